@@ -1,6 +1,8 @@
-import json
+import functools
+import logging
 import os
 from collections.abc import Callable
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional, Union
 
@@ -9,6 +11,150 @@ from src.utils.config import ConfigError
 
 from .environment import get_environment_config
 from .logging_config import setup_logging
+from .store import SharedConfigStore
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=256)
+def _split_path(key: str) -> tuple[str, ...]:
+    """Split a dotted configuration key into its path components."""
+    return tuple(key.split("."))
+
+
+# Compiled lookup functions for dotted keys, shared across Config instances
+_getter_cache: dict[str, Callable[[Any], Any]] = {}
+
+
+def _path_getter(key: str) -> Callable[[Any], Any]:
+    """Return a function that walks a dotted key path with C-level item lookups.
+
+    The returned getter raises KeyError or TypeError when the path does not
+    resolve.
+    """
+    getter = _getter_cache.get(key)
+    if getter is None:
+        getters = tuple(itemgetter(k) for k in _split_path(key))
+
+        def getter(data: Any) -> Any:
+            for get_item in getters:
+                data = get_item(data)
+            return data
+
+        _getter_cache[key] = getter
+    return getter
+
+
+def _compile_check(key: str, expected_type: Any) -> Callable[[Any], None] | None:
+    """Build a checker for a single schema entry."""
+    if isinstance(expected_type, type):
+
+        def check_type(value: Any) -> None:
+            if not isinstance(value, expected_type):
+                raise TypeError(
+                    f"Value for key '{key}' has wrong type. Expected {expected_type}, got {type(value)}"
+                )
+
+        return check_type
+
+    if callable(expected_type):
+
+        def check_callable(value: Any) -> None:
+            if not expected_type(value):
+                raise ValueError(f"Value for key '{key}' failed validation")
+
+        return check_callable
+
+    if isinstance(expected_type, dict):
+        nested = _compile_schema(expected_type)
+
+        def check_dict(value: Any) -> None:
+            if not isinstance(value, dict):
+                raise TypeError(
+                    f"Value for key '{key}' has wrong type. Expected dict, got {type(value)}"
+                )
+            nested(value)
+
+        return check_dict
+
+    if isinstance(expected_type, list):
+        # An empty list schema accepts any list
+        item_type = expected_type[0] if expected_type else None
+        item_is_type = isinstance(item_type, type)
+
+        def check_list(value: Any) -> None:
+            if not isinstance(value, list):
+                raise TypeError(
+                    f"Value for key '{key}' has wrong type. Expected list, got {type(value)}"
+                )
+            for i, item in enumerate(value):
+                if item_is_type:
+                    if not isinstance(item, item_type):
+                        raise TypeError(
+                            f"Item {i} in list '{key}' has wrong type. Expected {item_type}, got {type(item)}"
+                        )
+                elif callable(item_type) and not item_type(item):
+                    raise ValueError(f"Item {i} in list '{key}' failed validation")
+
+        return check_list
+
+    return None
+
+
+def _compile_schema(schema: dict[str, Any]) -> Callable[[dict[str, Any]], None]:
+    """Compile a validation schema into a checker.
+
+    The per-key type dispatch happens once here rather than for every value,
+    and nested schemas are checked by their own compiled checkers.
+    """
+    checks = []
+    for key, expected_type in schema.items():
+        check = _compile_check(key, expected_type)
+        if check is not None:
+            checks.append((key, check))
+
+    def validate_data(data: dict[str, Any]) -> None:
+        for key, check in checks:
+            if key in data:
+                check(data[key])
+
+    return validate_data
+
+
+def _validate_dict(
+    data: dict[str, Any],
+    schema: dict[str, Any],
+    required_keys: list[str] | None = None,
+    optional_keys: list[str] | None = None,
+) -> bool:
+    """Validate a configuration dictionary against a schema.
+
+    See ``Config.validate`` for the schema format and raised exceptions.
+    """
+    # Handle empty schema
+    if not schema:
+        if required_keys:
+            raise ConfigError("Schema is empty but required keys are specified")
+        return True
+
+    # Check required keys in schema and config data
+    if required_keys:
+        for key in required_keys:
+            if key not in schema:
+                raise ConfigError(f"Required key '{key}' not found in schema")
+            if key not in data:
+                raise ConfigError(f"Required key '{key}' missing from config data")
+
+    # Check optional keys
+    if optional_keys:
+        for key in optional_keys:
+            if key not in schema:
+                raise ConfigError(f"Optional key '{key}' not found in schema")
+
+    # Validate values against the compiled schema
+    _compile_schema(schema)(data)
+
+    return True
 
 
 class Config:
@@ -25,19 +171,10 @@ class Config:
         config_dir = Path(config_dir_env) if config_dir_env else None
         self.env_config = get_environment_config(env, config_dir=config_dir)
         self._config_data: dict[str, Any] = {}
+        self._get_cache: dict[str, Any] = {}
         self._load_config()
         self._setup_logging()
 
-    def _deep_merge(self, base: dict, override: dict) -> dict:
-        """Recursively merge two dictionaries."""
-        result = base.copy()
-        for k, v in override.items():
-            if k in result and isinstance(result[k], dict) and isinstance(v, dict):
-                result[k] = self._deep_merge(result[k], v)
-            else:
-                result[k] = v
-        return result
-
     def _load_config(self) -> None:
         """Load configuration from JSON file, merging default and environment-specific configs."""
         config_dir = self.env_config.config_dir
@@ -45,20 +182,14 @@ class Config:
         default_path = config_dir / "config.json"
         env_path = config_dir / f"config.{env}.json"
 
-        base_config = {}
-        env_config = {}
-
-        if default_path.exists():
-            with open(default_path) as f:
-                base_config = json.load(f)
-        if env_path.exists():
-            with open(env_path) as f:
-                env_config = json.load(f)
-
-        self._config_data = self._deep_merge(base_config, env_config)
-        print(f"DEBUG: Loaded config (merged): base={default_path}, env={env_path}")
+        # The store hands out a private copy of the parsed data
+        self._config_data = SharedConfigStore.get(default_path, env_path)
+        self._invalidate()
+        logger.debug(
+            "Loaded config (merged): base=%s, env=%s", default_path, env_path
+        )
         if not self._config_data:
-            print(f"DEBUG: No config data loaded from {default_path} or {env_path}")
+            logger.debug("No config data loaded from %s or %s", default_path, env_path)
 
     def _setup_logging(self) -> None:
         """Set up logging configuration."""
@@ -76,21 +207,45 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key.split(".")
-        value = self._config_data
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+        try:
+            return self._resolve(key)
+        except KeyError:
+            return default
+
+    def _resolve(self, key: str) -> Any:
+        """Resolve a dotted key, caching leaf values.
+
+        Dicts and lists are returned uncached, and since callers may edit
+        them in place, handing one out drops the cached leaves.
+
+        Raises:
+            KeyError: If the key path does not exist
+        """
+        try:
+            return self._get_cache[key]
+        except KeyError:
+            pass
+
+        try:
+            value = _path_getter(key)(self._config_data)
+        except (KeyError, TypeError, IndexError):
+            raise KeyError(f"Configuration key '{key}' not found") from None
+        if isinstance(value, (dict, list)):
+            self._get_cache.clear()
+        else:
+            self._get_cache[key] = value
         return value
 
+    def _invalidate(self) -> None:
+        """Drop cached lookups after the configuration data changes."""
+        self._get_cache.clear()
+
     def __getitem__(self, key: str) -> Any:
         """
         Get configuration value using dictionary syntax.
 
         Args:
-            key: Configuration key
+            key: Configuration key (supports dot notation for nested keys)
 
         Returns:
             Configuration value
@@ -98,9 +253,7 @@ class Config:
         Raises:
             KeyError: If key is not found
         """
-        if key not in self._config_data:
-            raise KeyError(f"Configuration key '{key}' not found")
-        return self._config_data[key]
+        return self._resolve(key)
 
     @property
     def environment(self) -> str:
@@ -120,6 +273,7 @@ class Config:
             value: Configuration value
         """
         self._config_data[key] = value
+        self._invalidate()
 
     def delete(self, key: str) -> None:
         """Delete a configuration key.
@@ -129,10 +283,12 @@ class Config:
         """
         if key in self._config_data:
             del self._config_data[key]
+            self._invalidate()
 
     def clear(self) -> None:
         """Clear all configuration data."""
         self._config_data.clear()
+        self._invalidate()
 
     def load(self, config_path: str) -> None:
         """Load configuration from a file.
@@ -141,6 +297,7 @@ class Config:
             config_path: Path to the configuration file
         """
         self._config_data = load_config(config_path)
+        self._invalidate()
 
     def save(self, config_path: str) -> None:
         """Save configuration to a file.
@@ -171,73 +328,7 @@ class Config:
             TypeError: If a value has the wrong type
             ValueError: If a value fails validation
         """
-        # Handle empty schema
-        if not schema:
-            if required_keys:
-                raise ConfigError("Schema is empty but required keys are specified")
-            return True
-
-        # Check required keys in schema and config data
-        if required_keys:
-            for key in required_keys:
-                if key not in schema:
-                    raise ConfigError(f"Required key '{key}' not found in schema")
-                if key not in self._config_data:
-                    raise ConfigError(f"Required key '{key}' missing from config data")
-
-        # Check optional keys
-        if optional_keys:
-            for key in optional_keys:
-                if key not in schema:
-                    raise ConfigError(f"Optional key '{key}' not found in schema")
-
-        # Validate values against schema
-        for key, expected_type in schema.items():
-            if key not in self._config_data:
-                if required_keys and key in required_keys:
-                    raise ConfigError(f"Required key '{key}' missing from config data")
-                continue
-
-            value = self._config_data[key]
-            if isinstance(expected_type, type):
-                if not isinstance(value, expected_type):
-                    raise TypeError(
-                        f"Value for key '{key}' has wrong type. Expected {expected_type}, got {type(value)}"
-                    )
-            elif callable(expected_type):
-                if not expected_type(value):
-                    raise ValueError(f"Value for key '{key}' failed validation")
-            elif isinstance(expected_type, dict):
-                if not isinstance(value, dict):
-                    raise TypeError(
-                        f"Value for key '{key}' has wrong type. Expected dict, got {type(value)}"
-                    )
-                # Recursively validate nested schema
-                nested_config = Config()
-                nested_config._config_data = value
-                nested_config.validate(
-                    expected_type, required_keys=None, optional_keys=None
-                )
-            elif isinstance(expected_type, list):
-                if not isinstance(value, list):
-                    raise TypeError(
-                        f"Value for key '{key}' has wrong type. Expected list, got {type(value)}"
-                    )
-                # Validate list items
-                item_type = expected_type[0]
-                for i, item in enumerate(value):
-                    if isinstance(item_type, type):
-                        if not isinstance(item, item_type):
-                            raise TypeError(
-                                f"Item {i} in list '{key}' has wrong type. Expected {item_type}, got {type(item)}"
-                            )
-                    elif callable(item_type):
-                        if not item_type(item):
-                            raise ValueError(
-                                f"Item {i} in list '{key}' failed validation"
-                            )
-
-        return True
+        return _validate_dict(self._config_data, schema, required_keys, optional_keys)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the configuration to a dictionary.
@@ -245,4 +336,6 @@ class Config:
         Returns:
             The configuration as a dictionary.
         """
+        # Callers may edit the returned dict in place
+        self._invalidate()
         return self._config_data
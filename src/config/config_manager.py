@@ -6,6 +6,10 @@ from pathlib import Path
 from typing import Any
 
 from src.config.environment import get_environment_config
+from src.config.store import SharedConfigStore
+
+# Shared instances keyed by config path, stored with the file mtime they were loaded at
+_INSTANCES: dict[str, tuple[float, "ConfigManager"]] = {}
 
 
 class ConfigManager:
@@ -21,8 +25,35 @@ class ConfigManager:
         self.config_path = config_path
         self.env_config = get_environment_config(env, config_dir=Path("config"))
         self.config: dict[str, Any] = {}
+        self._version = 0
         self.load_config()
 
+    @classmethod
+    def shared(cls, config_path: str = "config/config.json") -> "ConfigManager":
+        """Return a process-wide instance for ``config_path``.
+
+        The cached instance is reused until the file's modification time changes,
+        so repeated callers avoid re-reading and re-validating the configuration.
+
+        Args:
+            config_path: Path to the base JSON configuration file
+
+        Returns:
+            The shared ConfigManager for this path
+        """
+        try:
+            mtime = os.path.getmtime(config_path)
+        except OSError:
+            mtime = -1.0
+
+        cached = _INSTANCES.get(config_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        instance = cls(config_path)
+        _INSTANCES[config_path] = (mtime, instance)
+        return instance
+
     def load_config(self) -> None:
         """Load configuration from JSON files, merging default and environment-specific configs."""
         config_dir = self.env_config.config_dir
@@ -30,28 +61,9 @@ class ConfigManager:
         default_path = config_dir / "config.json"
         env_path = config_dir / f"config.{env}.json"
 
-        base_config = {}
-        env_config = {}
-
-        if default_path.exists():
-            with open(default_path) as f:
-                base_config = json.load(f)
-        if env_path.exists():
-            with open(env_path) as f:
-                env_config = json.load(f)
-
-        self.config = self._deep_merge(base_config, env_config)
+        self.config = SharedConfigStore.get(default_path, env_path)
         self._validate_config()
-
-    def _deep_merge(self, base: dict, override: dict) -> dict:
-        """Recursively merge two dictionaries."""
-        result = base.copy()
-        for k, v in override.items():
-            if k in result and isinstance(result[k], dict) and isinstance(v, dict):
-                result[k] = self._deep_merge(result[k], v)
-            else:
-                result[k] = v
-        return result
+        self._version += 1
 
     def _validate_config(self) -> None:
         """Validate the loaded configuration."""
@@ -85,6 +97,15 @@ class ConfigManager:
                 return default
         return value
 
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever the configuration is loaded, replaced or saved.
+
+        Lets consumers cache data derived from the config and detect when it
+        goes stale.
+        """
+        return self._version
+
     def reload(self) -> None:
         """Reload configuration from file."""
         self.load_config()
@@ -101,8 +122,11 @@ class ConfigManager:
         """Save the current configuration to the JSON file."""
         with open(self.config_path, "w") as f:
             json.dump(self.config, f, indent=2, sort_keys=False)
+        # Callers may have edited the dict from to_dict() in place before saving
+        self._version += 1
 
     def set_config(self, new_config: dict[str, Any]) -> None:
         """Replace the current config dict and validate it."""
         self.config = new_config
         self._validate_config()
+        self._version += 1
@@ -0,0 +1,121 @@
+"""Shared, process-wide cache of parsed configuration files."""
+
+import copy
+import json
+import threading
+from pathlib import Path
+from typing import Any, ClassVar
+
+import yaml
+
+# Prefer orjson for parsing config files when it is available
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Use the libyaml-backed loader when PyYAML was built against libyaml
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+
+def _has_nested_dict_conflict(base: dict, override: dict) -> bool:
+    """Return True if any shared key maps to a dict on both sides."""
+    for k, v in override.items():
+        if isinstance(v, dict) and isinstance(base.get(k), dict):
+            return True
+    return False
+
+
+def _deep_merge(base: dict, override: dict) -> dict:
+    """Recursively merge two dictionaries.
+
+    Inputs are freshly parsed and never mutated, so an empty side lets the
+    other be returned as-is without copying.
+    """
+    if not override:
+        return base
+    if not base:
+        return override
+    if not _has_nested_dict_conflict(base, override):
+        # Override replaces whole subtrees; a flat merge is enough
+        return {**base, **override}
+    result = {**base}
+    for k, v in override.items():
+        base_value = result.get(k)
+        if isinstance(base_value, dict) and isinstance(v, dict):
+            result[k] = _deep_merge(base_value, v)
+        else:
+            result[k] = v
+    return result
+
+
+def _read_config_file(path: Path) -> dict[str, Any]:
+    """Read and parse a JSON or YAML config file based on its extension."""
+    data = path.read_bytes()
+    if path.suffix.lower() in (".yaml", ".yml"):
+        return yaml.load(data, Loader=_YamlLoader) or {}
+    return _json_loads(data)
+
+
+def _mtime(path: Path) -> int | None:
+    """Return the modification time of a file, or None if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+class SharedConfigStore:
+    """Loads configuration files once and shares the parsed data across consumers.
+
+    Both ``Config`` and ``ConfigManager`` read the same default and
+    environment-specific files; the merged result is cached by file
+    modification time so each file is parsed once until it changes.
+    """
+
+    _cache: ClassVar[
+        dict[tuple[Path, ...], tuple[tuple[int | None, ...], dict[str, Any]]]
+    ] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def get(cls, *paths: Path) -> dict[str, Any]:
+        """Return the merged configuration for the given files.
+
+        Later files override earlier ones; missing files are skipped. Each
+        caller gets its own deep copy, so edits never reach the cache or
+        other loaders.
+
+        Args:
+            paths: Config files in merge order (e.g. default, then environment)
+
+        Returns:
+            Merged configuration dictionary
+        """
+        key = tuple(path.resolve() for path in paths)
+        mtimes = tuple(_mtime(path) for path in key)
+
+        with cls._lock:
+            cached = cls._cache.get(key)
+            if cached is not None and cached[0] == mtimes:
+                return copy.deepcopy(cached[1])
+
+            merged: dict[str, Any] = {}
+            for path, mtime in zip(key, mtimes):
+                if mtime is None:
+                    continue
+                merged = _deep_merge(merged, _read_config_file(path))
+
+            cls._cache[key] = (mtimes, merged)
+            return copy.deepcopy(merged)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all cached configuration data."""
+        with cls._lock:
+            cls._cache.clear()
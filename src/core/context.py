@@ -0,0 +1,35 @@
+"""
+Shared application context.
+"""
+
+import logging
+
+from src.config import Config
+from src.config.config_manager import ConfigManager
+
+
+class AppContext:
+    """Configuration objects shared by reference across services.
+
+    Built once at startup so every service reads the same parsed
+    configuration instead of loading its own copy.
+    """
+
+    __slots__ = ("config", "config_manager", "logger")
+
+    def __init__(
+        self,
+        config: Config,
+        config_manager: ConfigManager,
+        logger: logging.Logger,
+    ) -> None:
+        """Initialize the application context.
+
+        Args:
+            config: Application configuration instance
+            config_manager: Shared configuration manager
+            logger: Application logger
+        """
+        self.config = config
+        self.config_manager = config_manager
+        self.logger = logger
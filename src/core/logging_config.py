@@ -2,22 +2,35 @@
 Logging configuration for the application.
 """
 
+import functools
 import logging
 import logging.config
 import os
 from pathlib import Path
 from typing import Any
 
+LOG_DIR = Path("logs")
+
+# Config dict most recently passed to dictConfig
+_applied_config: dict[str, Any] | None = None
+
 
 def get_logging_config() -> dict[str, Any]:
     """Get logging configuration dictionary.
 
+    The returned dict is cached per log level and shared between callers,
+    so it must not be modified.
+
     Returns:
         Dict containing logging configuration
     """
-    log_level = os.getenv("LOG_LEVEL", "INFO")
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
+    return _build_logging_config(os.getenv("LOG_LEVEL", "INFO"))
+
+
+@functools.lru_cache(maxsize=4)
+def _build_logging_config(log_level: str) -> dict[str, Any]:
+    """Build the logging configuration dictionary for a log level."""
+    log_dir = LOG_DIR
 
     return {
         "version": 1,
@@ -71,8 +84,20 @@ def get_logging_config() -> dict[str, Any]:
 
 
 def setup_logging() -> None:
-    """Set up logging configuration."""
-    logging.config.dictConfig(get_logging_config())
+    """Set up logging configuration.
+
+    Repeated calls with an unchanged configuration are no-ops, so existing
+    handlers are not torn down and rebuilt.
+    """
+    global _applied_config
+
+    config = get_logging_config()
+    if config is _applied_config:
+        return
+
+    LOG_DIR.mkdir(exist_ok=True)
+    logging.config.dictConfig(config)
+    _applied_config = config
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -11,31 +11,36 @@ import os
 import shutil
 import signal
 import sys
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
 from types import FrameType
 
 from src.config import Config
 from src.config.config_manager import ConfigManager
+from src.core.context import AppContext
 from src.services.calendar_visualizer import CalendarVisualizer
+from src.services.complementary_color_service import compute_all_complementary_colors
 from src.services.google_calendar import GoogleCalendarService
-from src.services.google_drive import GoogleDriveService
+from src.services.google_drive import GoogleDriveService, shutdown_cpu_pool
 from src.services.scheduler import SchedulerService
 from src.services.weather_service import WeatherService
 from src.services.web_config_ui import create_web_config_ui
 from src.slideshow.pygame_slideshow import PygameSlideshowEngine
 
-# Global flag for shutdown
-shutdown_requested = False
+# Global event for shutdown
+shutdown_event = threading.Event()
 slideshow_engine_global = None
 web_config_ui_global = None
 
 
 def signal_handler(signum: int, frame: FrameType | None) -> None:
     """Handle shutdown signals gracefully."""
-    global shutdown_requested, slideshow_engine_global, web_config_ui_global
+    global slideshow_engine_global, web_config_ui_global
     logger = logging.getLogger(__name__)
     logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-    shutdown_requested = True
+    shutdown_event.set()
 
     # Stop the slideshow engine if it exists
     if slideshow_engine_global:
@@ -53,10 +58,46 @@ def initialize_config() -> Config:
     return Config()
 
 
+def initialize_services(
+    ctx: AppContext, parallel: bool = True
+) -> tuple[GoogleDriveService, GoogleCalendarService, WeatherService, SchedulerService]:
+    """Create the independent startup services.
+
+    Each constructor does its own credential loading and API handshakes, so by
+    default they run concurrently and startup waits only for the slowest one.
+
+    Args:
+        ctx: Shared application context
+        parallel: Construct the services concurrently instead of one by one
+
+    Returns:
+        The Google Drive, Google Calendar, Weather and Scheduler services
+    """
+    if not parallel:
+        return (
+            GoogleDriveService(ctx.config),
+            GoogleCalendarService(ctx.config),
+            WeatherService(ctx.config_manager),
+            SchedulerService(ctx.config),
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        drive_future = executor.submit(GoogleDriveService, ctx.config)
+        calendar_future = executor.submit(GoogleCalendarService, ctx.config)
+        weather_future = executor.submit(WeatherService, ctx.config_manager)
+        scheduler_future = executor.submit(SchedulerService, ctx.config)
+        return (
+            drive_future.result(),
+            calendar_future.result(),
+            weather_future.result(),
+            scheduler_future.result(),
+        )
+
+
 def main() -> None:
     """Main entry point for the Family Center application."""
     print("🔍 DEBUG: main() function called")
-    global shutdown_requested, slideshow_engine_global, web_config_ui_global
+    global slideshow_engine_global, web_config_ui_global
 
     # Set up signal handlers for graceful shutdown
     print("🔍 DEBUG: Setting up signal handlers...")
@@ -83,6 +124,11 @@ def main() -> None:
         action="store_true",
         help="Skip Google Drive sync and use existing local files",
     )
+    parser.add_argument(
+        "--incremental-sync",
+        action="store_true",
+        help="Keep existing local media and only download files changed in Google Drive",
+    )
     parser.add_argument(
         "--skip-calendar",
         action="store_true",
@@ -93,6 +139,11 @@ def main() -> None:
         action="store_true",
         help="Skip weather sync and use existing weather images",
     )
+    parser.add_argument(
+        "--serial-init",
+        action="store_true",
+        help="Initialize services one at a time instead of concurrently",
+    )
     parser.add_argument(
         "--web-config",
         action="store_true",
@@ -109,6 +160,7 @@ def main() -> None:
     print("🔍 DEBUG: Arguments parsed successfully")
 
     scheduler_service = None
+    color_executor = None
     web_config_ui = None
     logger = None
     slideshow_engine = None
@@ -126,9 +178,13 @@ def main() -> None:
         # Initialize configuration
         logger.info("Step 2: Initializing configuration...")
         print("🔍 DEBUG: Step 2 - Starting configuration initialization...")
-        config = initialize_config()
+        ctx = AppContext(
+            config=initialize_config(),
+            config_manager=ConfigManager.shared(),
+            logger=logger,
+        )
+        config = ctx.config
         print("🔍 DEBUG: Step 2a - Config initialized")
-        config_manager = ConfigManager()
         print("🔍 DEBUG: Step 2b - ConfigManager initialized")
         logger.info("✅ Configuration initialized successfully")
 
@@ -136,36 +192,25 @@ def main() -> None:
         print("🔍 DEBUG: Step 3 - Family Center application starting...")
 
         # Initialize services
-        print("🔍 DEBUG: Step 4 - Starting Google Drive service initialization...")
-        logger.info("Step 4: Initializing Google Drive service...")
-        google_drive_service = GoogleDriveService(config)
-        print("🔍 DEBUG: Step 4a - Google Drive service created")
-        logger.info("✅ Google Drive service initialized")
-
-        print("🔍 DEBUG: Step 5 - Starting Google Calendar service initialization...")
-        logger.info("Step 5: Initializing Google Calendar service...")
-        google_calendar_service = GoogleCalendarService(config)
-        print("🔍 DEBUG: Step 5a - Google Calendar service created")
-        logger.info("✅ Google Calendar service initialized")
-
-        print("🔍 DEBUG: Step 6 - Starting Weather service initialization...")
-        logger.info("Step 6: Initializing Weather service...")
-        weather_service = WeatherService(ConfigManager())
-        print("🔍 DEBUG: Step 6a - Weather service created")
-        logger.info("✅ Weather service initialized")
-
-        print("🔍 DEBUG: Step 7 - Starting Scheduler service initialization...")
-        logger.info("Step 7: Initializing Scheduler service...")
-        scheduler_service = SchedulerService(config)
-        print("🔍 DEBUG: Step 7a - Scheduler service created")
-        logger.info("✅ Scheduler service initialized")
+        print("🔍 DEBUG: Steps 4-7 - Starting service initialization...")
+        logger.info(
+            "Steps 4-7: Initializing Google Drive, Google Calendar, Weather and Scheduler services..."
+        )
+        (
+            google_drive_service,
+            google_calendar_service,
+            weather_service,
+            scheduler_service,
+        ) = initialize_services(ctx, parallel=not args.serial_init)
+        print("🔍 DEBUG: Steps 4-7a - Services created")
+        logger.info("✅ Services initialized")
 
         # Initialize web content service (Sprint 6)
         print("🔍 DEBUG: Step 8 - Starting web content service initialization...")
         logger.info("Step 8: Initializing web content service...")
         from src.services.web_content_service import create_web_content_service
 
-        web_content_service = create_web_content_service(config_manager)
+        web_content_service = create_web_content_service(ctx.config_manager)
         print("🔍 DEBUG: Step 8a - Web content service created")
         logger.info("✅ Web content service initialized")
 
@@ -174,12 +219,10 @@ def main() -> None:
         if args.web_config:
             logger.info("Step 9: Starting web configuration interface...")
             print("🔍 DEBUG: Step 9a - Creating web config UI...")
-            web_config_ui = create_web_config_ui(config_manager, web_content_service)
+            web_config_ui = create_web_config_ui(ctx.config_manager, web_content_service)
             web_config_ui_global = web_config_ui
 
             # Start web config UI in a separate thread
-            import threading
-
             print("🔍 DEBUG: Step 9b - Starting web config thread...")
             web_config_thread = threading.Thread(
                 target=web_config_ui.start,
@@ -195,13 +238,11 @@ def main() -> None:
             logger.info("Step 9: Skipping web configuration interface")
             print("🔍 DEBUG: Step 9a - Web config interface skipped")
 
-        # Compute complementary colors for all images at startup - TEMPORARILY DISABLED
-        print("🔍 DEBUG: Step 10 - Skipping complementary colors...")
+        # Complementary colors are computed in the background once media is synced
+        print("🔍 DEBUG: Step 10 - Deferring complementary colors...")
         logger.info(
-            "Step 10: Skipping complementary colors computation (temporarily disabled for debugging)"
+            "Step 10: Complementary colors will be computed in the background after sync"
         )
-        print("🔍 DEBUG: Step 10a - Complementary colors skipped")
-        logger.info("✅ Complementary colors computation skipped")
 
         # Handle sync operations
         print("🔍 DEBUG: Step 11 - Checking sync operations...")
@@ -213,25 +254,49 @@ def main() -> None:
                 "google_drive.local_media_path", "media/remote_drive"
             )
 
-            # Clean up existing media directory for fresh sync
-            if os.path.exists(media_path):
+            if not args.incremental_sync:
+                # Clean up existing media directory for fresh sync
                 logger.info(f"Cleaning existing media directory: {media_path}")
-                shutil.rmtree(media_path)
-            os.makedirs(media_path, exist_ok=True)
+                google_drive_service.clear_tracking()
+                shutil.rmtree(media_path, ignore_errors=True)
+            Path(media_path).mkdir(parents=True, exist_ok=True)
 
             logger.info(f"Syncing Google Drive media to {media_path}...")
-            files = google_drive_service.list_files(google_drive_service.folder_id)
-            logger.info(f"Found {len(files)} files in Google Drive folder")
+            files = google_drive_service.iter_files(google_drive_service.folder_id)
 
-            for file in files:
-                file_id = file["id"]
-                file_path = os.path.join(media_path, file["name"])
-                try:
+            max_workers = config.get("google_drive.sync.max_concurrent_downloads", 8)
+            sync_time = datetime.now().isoformat()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for file in files:
                     logger.info(f"Downloading {file['name']}...")
-                    google_drive_service.download_file_direct(file_id, file_path)
-                    logger.info(f"Successfully downloaded: {file['name']}")
-                except Exception as e:
-                    logger.error(f"Failed to download {file['name']}: {e}")
+                    future = executor.submit(
+                        google_drive_service.download_file_direct,
+                        file["id"],
+                        os.path.join(media_path, file["name"]),
+                        file,
+                        sync_time,
+                    )
+                    futures[future] = file
+                logger.info(f"Found {len(futures)} files in Google Drive folder")
+
+                for future in as_completed(futures):
+                    file = futures[future]
+                    try:
+                        if future.result():
+                            logger.info(f"Successfully downloaded: {file['name']}")
+                        else:
+                            logger.info(f"Unchanged, skipped: {file['name']}")
+                    except Exception as e:
+                        logger.error(f"Failed to download {file['name']}: {e}")
+
+            # Save the downloads' tracking updates in one rewrite; an
+            # incremental sync also removes files deleted from Google Drive
+            google_drive_service.finalize_sync(
+                {file["id"] for file in futures.values()}
+                if args.incremental_sync
+                else None
+            )
 
             logger.info("✅ Google Drive sync completed.")
             print("🔍 DEBUG: Step 11b - Google Drive sync completed")
@@ -241,6 +306,13 @@ def main() -> None:
             )
             print("🔍 DEBUG: Step 11a - Google Drive sync skipped")
 
+        # Compute complementary colors off the main thread; the slideshow falls
+        # back to its default background until the results land
+        color_executor = ThreadPoolExecutor(max_workers=1)
+        color_future = color_executor.submit(compute_all_complementary_colors)
+        print("🔍 DEBUG: Step 11c - Complementary colors computing in background")
+        logger.info("✅ Complementary colors computation started in background")
+
         # Calendar sync
         print("🔍 DEBUG: Step 12 - Checking calendar sync...")
         if not args.skip_calendar:
@@ -288,13 +360,16 @@ def main() -> None:
         print("🔍 DEBUG: Step 15 - Initializing Pygame slideshow engine...")
         logger.info("Step 15: Initializing Pygame slideshow engine...")
         slideshow_engine = PygameSlideshowEngine(
-            config_manager=config_manager,
+            config_manager=ctx.config_manager,
         )
         print("🔍 DEBUG: Step 15a - Pygame slideshow engine created")
         logger.info("✅ Pygame slideshow engine initialized")
 
         # Set global reference for signal handler
         slideshow_engine_global = slideshow_engine
+        color_future.add_done_callback(
+            lambda _: slideshow_engine.reload_complementary_colors()
+        )
         print("🔍 DEBUG: Step 15b - Global reference set")
 
         print("🔍 DEBUG: Step 16 - Starting slideshow...")
@@ -311,21 +386,17 @@ def main() -> None:
         print("🔍 DEBUG: Step 17 - Entering main application loop...")
         logger.info("Step 17: Entering main application loop...")
         try:
-            loop_count = 0
             print("🔍 DEBUG: Step 17a - Main loop starting...")
-            while not shutdown_requested:
-                time.sleep(0.1)  # Check more frequently for shutdown signal
-                loop_count += 1
 
-                if loop_count % 100 == 0:  # Log every 10 seconds
-                    logger.info(f"Main loop running... (iteration {loop_count})")
-                    print(f"🔍 DEBUG: Main loop iteration {loop_count}")
+            def watch_slideshow() -> None:
+                """Signal shutdown once the slideshow stops running."""
+                while not shutdown_event.wait(timeout=1.0):
+                    if not getattr(slideshow_engine, "running", False):
+                        logger.info("Slideshow stopped, exiting main loop")
+                        shutdown_event.set()
 
-                # Also check if slideshow has stopped
-                if slideshow_engine and not getattr(slideshow_engine, "running", False):
-                    logger.info("Slideshow stopped, exiting main loop")
-                    print("🔍 DEBUG: Slideshow stopped, exiting main loop")
-                    break
+            threading.Thread(target=watch_slideshow, daemon=True).start()
+            shutdown_event.wait()
 
         except KeyboardInterrupt:
             logger.info("Application interrupted by user")
@@ -355,6 +426,12 @@ def main() -> None:
                 logger.info("Stopping scheduler service...")
             scheduler_service.stop()
 
+        if color_executor:
+            color_executor.shutdown(wait=False, cancel_futures=True)
+
+        # Reap the image conversion workers started by the Drive sync
+        shutdown_cpu_pool()
+
         # Clear global reference
         slideshow_engine_global = None
         web_config_ui_global = None
@@ -1,15 +1,83 @@
+import functools
 import json
 import re
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Any
 
+# Prefer orjson for the tracking file when it is available
+try:
+    import orjson
 
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+
+# Capitol Center date formats: "Jul 18, 7:00pm & Jul 19, 7:00pm", "Jul 20, 7:00pm"
+_CAPITOL_DATE_RE = re.compile(r"(\w{3}\s+\d{1,2})")
+_DATE_FORMATS = (
+    "%b %d",  # Jul 18
+    "%B %d",  # July 18
+)
+
+# Tracking-file writes run on one worker so they land in submission order
+_tracking_writer = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="capitol-tracking"
+)
+
+
+def _queue_tracking_write(write: Callable[..., None], *args: Any) -> Future | None:
+    """Queue a tracking-file write on the writer thread.
+
+    Once the writer has shut down at interpreter exit the write runs in place
+    and None is returned.
+    """
+    try:
+        return _tracking_writer.submit(write, *args)
+    except RuntimeError:
+        write(*args)
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_month_day(date_str: str) -> tuple[int, int] | None:
+    """Extract the (month, day) of the first date in a Capitol Center date string.
+
+    Results do not depend on the current time, so they are cached by the raw
+    string; callers apply the year themselves.
+    """
+    date_match = _CAPITOL_DATE_RE.search(date_str)
+    if date_match:
+        date_part = date_match.group(1)
+
+        # Try various date formats
+        for fmt in _DATE_FORMATS:
+            try:
+                parsed_date = datetime.strptime(date_part, fmt)
+                return parsed_date.month, parsed_date.day
+            except ValueError:
+                continue
+    return None
+
+
+@dataclass(frozen=True, slots=True)
 class EventInfo:
-    def __init__(self, title: str, date: str, venue: str = "", description: str = ""):
-        self.title = title
-        self.date = date
-        self.venue = venue
-        self.description = description
+    title: str
+    date: str
+    venue: str = ""
+    # Not part of an event's identity
+    description: str = field(default="", compare=False)
 
     def to_dict(self) -> dict:
         return {
@@ -19,18 +87,6 @@ class EventInfo:
             "description": self.description,
         }
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, EventInfo):
-            return False
-        return (
-            self.title == other.title
-            and self.date == other.date
-            and self.venue == other.venue
-        )
-
-    def __hash__(self) -> int:
-        return hash((self.title, self.date, self.venue))
-
 
 class CapitolCenterParser:
     def __init__(self) -> None:
@@ -47,33 +103,34 @@ class CapitolCenterParser:
             return set()
 
         try:
-            with open(self.tracking_file) as f:
-                data = json.load(f)
-                events = set()
-                future_events = []
-
-                for event_data in data.get("events", []):
-                    event = EventInfo(
-                        title=event_data.get("title", ""),
-                        date=event_data.get("date", ""),
-                        venue=event_data.get("venue", ""),
-                        description=event_data.get("description", ""),
-                    )
-
-                    # Only keep future events in the tracking
-                    if self._is_future_event(event):
-                        events.add(event)
-                        future_events.append(event_data)
-                    # Past events are filtered out
-
-                # If we filtered out past events, update the tracking file
-                if len(future_events) != len(data.get("events", [])):
-                    print(
-                        f"Cleaned up {len(data.get('events', [])) - len(future_events)} past events from Capitol Center tracking file"
-                    )
-                    self._save_events_dict(future_events)
-
-                return events
+            data = _json_loads(self.tracking_file.read_bytes())
+            events = set()
+            future_events = []
+            now = datetime.now()
+
+            for event_data in data.get("events", []):
+                event = EventInfo(
+                    title=event_data.get("title", ""),
+                    date=event_data.get("date", ""),
+                    venue=event_data.get("venue", ""),
+                    description=event_data.get("description", ""),
+                )
+
+                # Only keep future events in the tracking
+                if self._is_future_event(event, now):
+                    events.add(event)
+                    future_events.append(event_data)
+                # Past events are filtered out
+
+            # If we filtered out past events, update the tracking file
+            if len(future_events) != len(data.get("events", [])):
+                print(
+                    f"Cleaned up {len(data.get('events', [])) - len(future_events)} past events from Capitol Center tracking file"
+                )
+                # Rewrite in the background so construction doesn't block
+                _queue_tracking_write(self._save_events_dict, future_events)
+
+            return events
         except Exception as e:
             print(f"Error loading previous Capitol Center events: {e}")
             return set()
@@ -85,8 +142,10 @@ class CapitolCenterParser:
                 "last_updated": datetime.now().isoformat(),
                 "events": [event.to_dict() for event in events],
             }
-            with open(self.tracking_file, "w") as f:
-                json.dump(data, f, indent=2)
+            # Queue behind any pending cleanup write so it can't clobber this one
+            pending = _queue_tracking_write(self._write_tracking, data)
+            if pending is not None:
+                pending.result()
         except Exception as e:
             print(f"Error saving Capitol Center events: {e}")
 
@@ -94,63 +153,68 @@ class CapitolCenterParser:
         """Save events as dict objects to tracking file."""
         try:
             data = {"last_updated": datetime.now().isoformat(), "events": events}
-            with open(self.tracking_file, "w") as f:
-                json.dump(data, f, indent=2)
+            self._write_tracking(data)
         except Exception as e:
             print(f"Error saving Capitol Center events: {e}")
 
-    def _parse_date(self, date_str: str) -> datetime:
-        """Parse date string to datetime object."""
+    def _write_tracking(self, data: dict[str, Any]) -> None:
+        """Atomically replace the tracking file with the given data."""
+        tmp_path = self.tracking_file.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_json_dumps(data))
+        tmp_path.replace(self.tracking_file)
+
+    def _parse_date(self, date_str: str, now: datetime | None = None) -> datetime:
+        """Parse date string to datetime object.
+
+        Args:
+            date_str: Capitol Center date string
+            now: Current time; looked up when not provided
+        """
+        if now is None:
+            now = datetime.now()
         if not date_str or not date_str.strip():
-            return datetime.now()
+            return now
 
         try:
-            # Clean up the date string
-            date_str = date_str.strip()
-
-            # Capitol Center date formats: "Jul 18, 7:00pm & Jul 19, 7:00pm", "Jul 20, 7:00pm"
             # Extract the first date from the string
-            date_match = re.search(r"(\w{3}\s+\d{1,2})", date_str)
-            if date_match:
-                date_part = date_match.group(1)
-
-                # Try various date formats
-                formats = [
-                    "%b %d",  # Jul 18
-                    "%B %d",  # July 18
-                ]
-
-                for fmt in formats:
-                    try:
-                        parsed_date = datetime.strptime(date_part, fmt)
-                        # Assume current year
-                        current_year = datetime.now().year
-                        parsed_date = parsed_date.replace(year=current_year)
-                        return parsed_date
-                    except ValueError:
-                        continue
+            month_day = _parse_month_day(date_str.strip())
+            if month_day:
+                # Assume current year
+                return datetime(now.year, *month_day)
 
             # If no format matches, return current date
-            return datetime.now()
+            return now
         except Exception:
-            return datetime.now()
+            return now
+
+    def _is_future_event(self, event: EventInfo, now: datetime | None = None) -> bool:
+        """Check if event is in the future (not past).
 
-    def _is_future_event(self, event: EventInfo) -> bool:
-        """Check if event is in the future (not past)."""
+        Args:
+            event: Event to check
+            now: Current time; looked up when not provided
+        """
+        if now is None:
+            now = datetime.now()
         try:
-            event_date = self._parse_date(event.date)
+            event_date = self._parse_date(event.date, now)
             # Compare just the date part, not the time
-            event_date_only = event_date.date()
-            now_date_only = datetime.now().date()
-            return event_date_only >= now_date_only
+            return event_date.date() >= now.date()
         except Exception:
             return False
 
-    def _is_recent_event(self, event: EventInfo) -> bool:
-        """Check if event is from the last 7 days (expanded window for newly announced events)."""
+    def _is_recent_event(self, event: EventInfo, now: datetime | None = None) -> bool:
+        """Check if event is from the last 7 days (expanded window for newly announced events).
+
+        Args:
+            event: Event to check
+            now: Current time; looked up when not provided
+        """
+        if now is None:
+            now = datetime.now()
         try:
-            event_date = self._parse_date(event.date)
-            seven_days_ago = datetime.now() - timedelta(days=7)
+            event_date = self._parse_date(event.date, now)
+            seven_days_ago = now - timedelta(days=7)
             return event_date >= seven_days_ago
         except Exception:
             return False
@@ -179,9 +243,12 @@ class CapitolCenterParser:
         new_events = parsed_data.get("new_events", [])
 
         # Filter out past events - only show future events
-        future_events = [event for event in all_events if self._is_future_event(event)]
+        now = datetime.now()
+        future_events = [
+            event for event in all_events if self._is_future_event(event, now)
+        ]
         future_new_events = [
-            event for event in new_events if self._is_future_event(event)
+            event for event in new_events if self._is_future_event(event, now)
         ]
 
         # Priority order for events to show:
@@ -189,29 +256,32 @@ class CapitolCenterParser:
         # 2. Recent future events (last 7 days)
         # 3. Upcoming future events (next 5 events)
 
-        events_to_show = []
+        events_to_show: list[EventInfo] = []
+        seen: set[EventInfo] = set()
+
+        def add_events(events: list[EventInfo]) -> None:
+            for event in events:
+                if len(events_to_show) >= 5:
+                    return
+                if event not in seen:
+                    seen.add(event)
+                    events_to_show.append(event)
 
         # First, add newly announced future events
-        for event in future_new_events:
-            if event not in events_to_show:
-                events_to_show.append(event)
+        add_events(future_new_events)
 
         # Then add recent future events that aren't already included
-        recent_future_events = [
-            event for event in future_events if self._is_recent_event(event)
-        ]
-        for event in recent_future_events:
-            if event not in events_to_show:
-                events_to_show.append(event)
+        if len(events_to_show) < 5:
+            add_events(
+                [
+                    event
+                    for event in future_events
+                    if self._is_recent_event(event, now)
+                ]
+            )
 
         # Finally, add upcoming future events if we don't have enough
-        upcoming_future_events = future_events[:5]  # Next 5 future events
-        for event in upcoming_future_events:
-            if event not in events_to_show and len(events_to_show) < 5:
-                events_to_show.append(event)
-
-        # Limit to 5 events total
-        events_to_show = events_to_show[:5]
+        add_events(future_events[:5])  # Next 5 future events
 
         content_list = content["content"]
         for event in events_to_show:
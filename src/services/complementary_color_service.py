@@ -7,11 +7,27 @@ in the media directories. It should be called at startup and after
 Google Drive sync operations.
 """
 
-import json
+import functools
 import logging
+import multiprocessing
+import os
+import shutil
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
 from pathlib import Path
 from typing import Any
 
+from src.services.file_tracking import (
+    append_tracking,
+    color_index,
+    compact_tracking,
+    content_key,
+    journal_size,
+    load_tracking,
+)
+
 # Try to import color processing dependencies
 COLOR_ANALYSIS = True
 try:
@@ -20,8 +36,242 @@ except ImportError:
     COLOR_ANALYSIS = False
     ColorThief = None
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# NumPy + Pillow let us histogram pixels instead of running ColorThief's
+# pure-Python quantizer
+try:
+    import numpy as np
+
+    FAST_COLOR_ANALYSIS = Image is not None
+except ImportError:
+    FAST_COLOR_ANALYSIS = False
+    np = None
+
+# Let Pillow open HEIC photos when running outside the Drive service
+try:
+    import pillow_heif
+
+    pillow_heif.register_heif_opener()
+except ImportError:
+    pass
+
 logger = logging.getLogger(__name__)
 
+# File extensions treated as images
+_IMAGE_EXTENSIONS = frozenset(
+    {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".heic", ".heif"}
+)
+
+# Images are shrunk to at most this size before their pixels are counted
+_ANALYSIS_SIZE = (64, 64)
+
+# Larger images are shrunk to this size before ColorThief quantizes them
+_COLOR_SAMPLE_SIZE = (1024, 1024)
+
+# For each 60-degree hue sector, which of (chroma, x, 0) feeds R, G and B
+_HUE_SECTORS = (
+    (0, 1, 2),
+    (1, 0, 2),
+    (2, 0, 1),
+    (2, 1, 0),
+    (1, 2, 0),
+    (0, 2, 1),
+)
+
+
+def _dominant_via_bincount(pixels: "np.ndarray") -> tuple[int, int, int]:
+    """Find the most common color in an (N, 3) uint8 pixel array.
+
+    Pixels are bucketed at 4 bits per channel and the center of the fullest
+    bucket is returned.
+    """
+    key = (
+        (pixels[:, 0] >> 4).astype(np.uint16) << 8
+        | (pixels[:, 1] >> 4).astype(np.uint16) << 4
+        | (pixels[:, 2] >> 4).astype(np.uint16)
+    )
+    idx = int(np.bincount(key, minlength=4096).argmax())
+    return (
+        ((idx >> 8) & 0xF) * 16 + 8,
+        ((idx >> 4) & 0xF) * 16 + 8,
+        (idx & 0xF) * 16 + 8,
+    )
+
+
+def _dominant_from_rgba(rgba: "np.ndarray") -> tuple[int, int, int]:
+    """Get the dominant color of an (N, 4) uint8 RGBA pixel array.
+
+    Like ColorThief, mostly transparent and near-white pixels are ignored
+    unless nothing else is left.
+    """
+    rgb = rgba[:, :3]
+    keep = (rgba[:, 3] >= 125) & ~np.all(rgb > 250, axis=1)
+    if keep.any():
+        rgb = rgb[keep]
+    return _dominant_via_bincount(rgb)
+
+
+def _dominant_color(image_path: Path) -> tuple[int, int, int]:
+    """Get the dominant color of an image using a NumPy histogram."""
+    with Image.open(image_path) as img:
+        # Let JPEG decode at reduced scale when possible
+        img.draft("RGB", (_ANALYSIS_SIZE[0] * 2, _ANALYSIS_SIZE[1] * 2))
+        img.thumbnail(_ANALYSIS_SIZE)
+        rgba = np.asarray(img.convert("RGBA")).reshape(-1, 4)
+    return _dominant_from_rgba(rgba)
+
+
+def dominant_image_color(img: "Image.Image") -> tuple[int, int, int]:
+    """Get the dominant color of an image that is already decoded.
+
+    Lets callers that hold the pixels (e.g. after converting a HEIC photo)
+    skip decoding the file again. The image itself is left untouched.
+
+    Args:
+        img: Decoded Pillow image
+
+    Returns:
+        Dominant color as an RGB tuple
+    """
+    # Shrink most of the way with a cheap box reduction, leaving thumbnail()
+    # a 2x margin to resample from, as it does when opening a file
+    factor = min(img.width // _ANALYSIS_SIZE[0], img.height // _ANALYSIS_SIZE[1]) // 2
+    small = img.reduce(factor) if factor > 1 else img.copy()
+    small.thumbnail(_ANALYSIS_SIZE)
+    return _dominant_from_rgba(np.asarray(small.convert("RGBA")).reshape(-1, 4))
+
+
+def dominant_file_color(image_path: Path, quality: int = 1) -> tuple[int, int, int]:
+    """Get the dominant color of an image file.
+
+    Uses the NumPy histogram when available, otherwise ColorThief on a
+    downsized copy sampling every ``quality``-th pixel.
+
+    Args:
+        image_path: Path to the image file
+        quality: ColorThief pixel sampling step (1 samples every pixel)
+
+    Returns:
+        Dominant color as an RGB tuple
+    """
+    if FAST_COLOR_ANALYSIS:
+        return _dominant_color(image_path)
+
+    # ColorThief's quantizer is pure Python, so hand it a downsized copy
+    with Image.open(image_path) as img:
+        if max(img.size) <= _COLOR_SAMPLE_SIZE[0]:
+            return ColorThief(str(image_path)).get_color(quality=quality)
+        img.draft("RGB", _COLOR_SAMPLE_SIZE)
+        img.thumbnail(_COLOR_SAMPLE_SIZE)
+        buffer = BytesIO()
+        # PNG keeps the alpha ColorThief uses to skip transparent pixels
+        img.save(buffer, "PNG", compress_level=1)
+    buffer.seek(0)
+    return ColorThief(buffer).get_color(quality=quality)
+
+
+def _to_hex(r: int, g: int, b: int) -> str:
+    """Format an RGB triple as a ``#rrggbb`` string."""
+    return "#" + bytes((r, g, b)).hex()
+
+
+@functools.lru_cache(maxsize=4096)
+def _complement_hex(r: int, g: int, b: int) -> str:
+    """Return the background hex color that complements a dominant color.
+
+    The histogram path only ever yields 4096 distinct bin colors, so results
+    are memoized.
+    """
+    max_val = max(r, g, b)
+    min_val = min(r, g, b)
+    diff = max_val - min_val
+
+    if diff == 0:
+        # Grayscale has no hue; blend the RGB complement with a warm color.
+        # Its brightness is at least 75, so no boost is ever needed.
+        gray = 255 - r
+        return _to_hex((gray + 200) // 2, (gray + 150) // 2, (gray + 100) // 2)
+
+    # Method 1: Simple RGB complement
+    r_comp1 = 255 - r
+    g_comp1 = 255 - g
+    b_comp1 = 255 - b
+
+    # Method 2: HSV complement (more accurate color theory)
+    # Calculate hue
+    if max_val == r:
+        hue = (60 * ((g - b) / diff) + 360) % 360
+    elif max_val == g:
+        hue = (60 * ((b - r) / diff) + 120) % 360
+    else:
+        hue = (60 * ((r - g) / diff) + 240) % 360
+
+    # Complementary hue (opposite on color wheel)
+    comp_hue = (hue + 180) % 360
+
+    # Convert back to RGB
+    c = max_val / 255
+    x = c * (1 - abs((comp_hue / 60) % 2 - 1))
+    m = (max_val - c * 255) / 255
+
+    vals = (c, x, 0)
+    r_idx, g_idx, b_idx = _HUE_SECTORS[int(comp_hue // 60) % 6]
+    r_comp2, g_comp2, b_comp2 = vals[r_idx], vals[g_idx], vals[b_idx]
+
+    # Convert to 0-255 range
+    r_comp2 = int((r_comp2 + m) * 255)
+    g_comp2 = int((g_comp2 + m) * 255)
+    b_comp2 = int((b_comp2 + m) * 255)
+
+    # Combine both methods for better results
+    r_final = (r_comp1 + r_comp2) // 2
+    g_final = (g_comp1 + g_comp2) // 2
+    b_final = (b_comp1 + b_comp2) // 2
+
+    # Ensure minimum brightness and boost saturation
+    brightness = (r_final + g_final + b_final) / 3
+    if brightness < 50:
+        # Boost brightness while maintaining color
+        boost = 50 / brightness if brightness > 0 else 1.5
+        r_final = min(255, int(r_final * boost))
+        g_final = min(255, int(g_final * boost))
+        b_final = min(255, int(b_final * boost))
+
+    # Return as hex color
+    return _to_hex(r_final, g_final, b_final)
+
+
+def _compute_complementary_color(image_path: Path) -> str:
+    """Extract complementary color from an image for background.
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        Hex color string for complementary background
+    """
+    if not FAST_COLOR_ANALYSIS and (not COLOR_ANALYSIS or ColorThief is None):
+        return "#000000"  # Default fallback color
+
+    try:
+        # Get dominant color from image
+        dominant_color = dominant_file_color(image_path)
+
+        # Calculate complementary color (opposite on color wheel)
+        return _complement_hex(*dominant_color)
+    except Exception as e:
+        logger.debug(f"Could not extract complementary color from {image_path}: {e}")
+        return "#000000"  # Default fallback color
+
+
+def _compute_one(path_str: str) -> tuple[str, str]:
+    """Process-pool worker: return the image path with its complementary color."""
+    return path_str, _compute_complementary_color(Path(path_str))
+
 
 class ComplementaryColorService:
     """Service for computing and caching complementary colors for images."""
@@ -46,17 +296,7 @@ class ComplementaryColorService:
         Returns:
             True if the file is an image file
         """
-        image_extensions = {
-            ".jpg",
-            ".jpeg",
-            ".png",
-            ".gif",
-            ".bmp",
-            ".webp",
-            ".heic",
-            ".heif",
-        }
-        return file_path.suffix.lower() in image_extensions
+        return os.path.splitext(file_path.name)[1].lower() in _IMAGE_EXTENSIONS
 
     def _should_compute_complementary_color(self, file_path: Path) -> bool:
         """Check if we should compute complementary color for this file.
@@ -87,88 +327,7 @@ class ComplementaryColorService:
         Returns:
             Hex color string for complementary background
         """
-        if not COLOR_ANALYSIS or ColorThief is None:
-            return "#000000"  # Default fallback color
-
-        try:
-            # Get dominant color from image
-            color_thief = ColorThief(str(image_path))
-            dominant_color = color_thief.get_color(quality=1)
-
-            # Calculate complementary color (opposite on color wheel)
-            r, g, b = dominant_color
-
-            # Method 1: Simple RGB complement
-            r_comp1 = 255 - r
-            g_comp1 = 255 - g
-            b_comp1 = 255 - b
-
-            # Method 2: HSV complement (more accurate color theory)
-            # Convert to HSV
-            max_val = max(r, g, b)
-            min_val = min(r, g, b)
-            diff = max_val - min_val
-
-            if diff == 0:
-                # Grayscale - use a warm color
-                r_comp2, g_comp2, b_comp2 = 200, 150, 100
-            else:
-                # Calculate hue
-                if max_val == r:
-                    hue = (60 * ((g - b) / diff) + 360) % 360
-                elif max_val == g:
-                    hue = (60 * ((b - r) / diff) + 120) % 360
-                else:
-                    hue = (60 * ((r - g) / diff) + 240) % 360
-
-                # Complementary hue (opposite on color wheel)
-                comp_hue = (hue + 180) % 360
-
-                # Convert back to RGB
-                c = max_val / 255
-                x = c * (1 - abs((comp_hue / 60) % 2 - 1))
-                m = (max_val - c * 255) / 255
-
-                if 0 <= comp_hue < 60:
-                    r_comp2, g_comp2, b_comp2 = c, x, 0
-                elif 60 <= comp_hue < 120:
-                    r_comp2, g_comp2, b_comp2 = x, c, 0
-                elif 120 <= comp_hue < 180:
-                    r_comp2, g_comp2, b_comp2 = 0, c, x
-                elif 180 <= comp_hue < 240:
-                    r_comp2, g_comp2, b_comp2 = 0, x, c
-                elif 240 <= comp_hue < 300:
-                    r_comp2, g_comp2, b_comp2 = x, 0, c
-                else:
-                    r_comp2, g_comp2, b_comp2 = c, 0, x
-
-                # Convert to 0-255 range
-                r_comp2 = int((r_comp2 + m) * 255)
-                g_comp2 = int((g_comp2 + m) * 255)
-                b_comp2 = int((b_comp2 + m) * 255)
-
-            # Combine both methods for better results
-            r_final = (r_comp1 + r_comp2) // 2
-            g_final = (g_comp1 + g_comp2) // 2
-            b_final = (b_comp1 + b_comp2) // 2
-
-            # Ensure minimum brightness and boost saturation
-            brightness = (r_final + g_final + b_final) / 3
-            if brightness < 50:
-                # Boost brightness while maintaining color
-                boost = 50 / brightness if brightness > 0 else 1.5
-                r_final = min(255, int(r_final * boost))
-                g_final = min(255, int(g_final * boost))
-                b_final = min(255, int(b_final * boost))
-
-            # Return as hex color
-            return f"#{r_final:02x}{g_final:02x}{b_final:02x}"
-
-        except Exception as e:
-            logger.debug(
-                f"Could not extract complementary color from {image_path}: {e}"
-            )
-            return "#000000"  # Default fallback color
+        return _compute_complementary_color(image_path)
 
     def _load_tracking_data(self) -> dict[str, Any]:
         """Load the file tracking data.
@@ -176,62 +335,137 @@ class ComplementaryColorService:
         Returns:
             Dictionary containing file tracking data
         """
-        if self.tracking_file.exists():
+        if self.tracking_file.exists() or journal_size(self.tracking_file):
             try:
-                with open(self.tracking_file) as f:
-                    return dict[str, Any](json.load(f))
+                return load_tracking(self.tracking_file)
             except Exception as e:
                 logger.warning(f"Failed to load file tracking data: {e}")
         return {}
 
-    def _save_tracking_data(self, tracking_data: dict[str, Any]) -> None:
-        """Save the file tracking data.
+    def _backup_tracking_file(self, backup_file: Path) -> None:
+        """Snapshot the current tracking file without re-reading it.
 
-        Args:
-            tracking_data: Dictionary containing file tracking data
+        A hard link shares the existing data blocks and keeps the tracking
+        file in place for concurrent readers; filesystems without hard links
+        fall back to a copy.
         """
+        link_tmp = backup_file.with_suffix(".bak.tmp")
+        try:
+            link_tmp.unlink(missing_ok=True)
+            os.link(self.tracking_file, link_tmp)
+            os.replace(link_tmp, backup_file)
+        except OSError:
+            shutil.copy2(self.tracking_file, backup_file)
+
+    def _compact_tracking_data(self) -> None:
+        """Fold the tracking journal into the tracking file, keeping a backup."""
         try:
             # Create backup
             if self.tracking_file.exists():
                 backup_file = self.tracking_file.with_suffix(".json.bak")
-                with open(self.tracking_file) as src, open(backup_file, "w") as dst:
-                    dst.write(src.read())
+                self._backup_tracking_file(backup_file)
                 logger.info(f"Created backup: {backup_file}")
 
-            # Save updated data
-            with open(self.tracking_file, "w") as f:
-                json.dump(tracking_data, f, indent=2)
+            compact_tracking(self.tracking_file)
             logger.info(f"Updated file tracking data: {self.tracking_file}")
 
         except Exception as e:
             logger.error(f"Failed to save file tracking data: {e}")
 
+    def _persist_changes(
+        self, tracking_data: dict[str, Any], changed_ids: set[str]
+    ) -> None:
+        """Record updated tracking entries.
+
+        Changed entries are appended to the tracking journal; the journal is
+        compacted into the tracking file once it outgrows it.
+
+        Args:
+            tracking_data: Complete tracking data
+            changed_ids: Ids of the entries that changed
+        """
+        if not changed_ids:
+            return
+
+        try:
+            append_tracking(
+                self.tracking_file, {fid: tracking_data[fid] for fid in changed_ids}
+            )
+            logger.info(
+                f"Journaled {len(changed_ids)} file tracking updates: {self.tracking_file}"
+            )
+        except OSError as e:
+            logger.error(f"Failed to journal file tracking data: {e}")
+            return
+
+        try:
+            main_size = self.tracking_file.stat().st_size
+        except OSError:
+            main_size = 0
+        if main_size == 0 or journal_size(self.tracking_file) > main_size:
+            self._compact_tracking_data()
+
+    def _scan_images(self, base_path: Path) -> Iterator[Path]:
+        """Yield image files directly inside ``base_path``.
+
+        Uses ``os.scandir`` so file-type checks come from the directory
+        listing rather than a stat per entry.
+        """
+        try:
+            with os.scandir(base_path) as it:
+                for entry in it:
+                    name = entry.name
+                    dot = name.rfind(".")
+                    # Like Path.suffix, leading dots don't start an extension
+                    if dot <= 0 or not name[:dot].lstrip("."):
+                        continue
+                    if name[dot:].lower() not in _IMAGE_EXTENSIONS:
+                        continue
+                    if "calendar" not in entry.path and entry.is_file():
+                        yield Path(entry.path)
+        except FileNotFoundError:
+            return
+
     def _discover_image_files(self) -> list[Path]:
         """Discover all image files in media directories.
 
         Returns:
             List of image file paths
         """
-        image_files = []
-
-        # Check remote drive
-        if self.remote_drive_path.exists():
-            for file_path in self.remote_drive_path.iterdir():
-                if file_path.is_file() and self._should_compute_complementary_color(
-                    file_path
-                ):
-                    image_files.append(file_path)
-
-        # Check local drive
-        if self.local_drive_path.exists():
-            for file_path in self.local_drive_path.iterdir():
-                if file_path.is_file() and self._should_compute_complementary_color(
-                    file_path
-                ):
-                    image_files.append(file_path)
-
+        # Files found here are already under the remote or local drive, so
+        # the parent-directory check in _should_compute_complementary_color
+        # is not needed
+        image_files = list(self._scan_images(self.remote_drive_path))
+        image_files.extend(self._scan_images(self.local_drive_path))
         return image_files
 
+    def _compute_colors(self, paths: list[str]) -> list[tuple[str, str]]:
+        """Compute complementary colors, spreading the work over CPU cores.
+
+        Args:
+            paths: Image paths to process
+
+        Returns:
+            (path, hex color) pairs in input order
+        """
+        workers = min(os.cpu_count() or 1, len(paths))
+        if workers > 1:
+            try:
+                # Spawn rather than fork: this runs on a background thread
+                # while download and UI threads hold locks of their own
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as executor:
+                    chunksize = max(1, len(paths) // (workers * 4))
+                    return list(executor.map(_compute_one, paths, chunksize=chunksize))
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(
+                    f"Process pool unavailable, computing colors serially: {e}"
+                )
+
+        return [_compute_one(path_str) for path_str in paths]
+
     def compute_complementary_colors(self) -> None:
         """Compute and cache complementary colors for all images in media directories."""
         logger.info("Starting complementary color computation for all images...")
@@ -247,52 +481,100 @@ class ComplementaryColorService:
         updated_count = 0
         total_images = 0
 
+        # Index tracking entries by path; the first entry for a path wins
+        path_to_id: dict[str, str] = {}
+        for fid, file_info in tracking_data.items():
+            path = file_info.get("path")
+            if path:
+                path_to_id.setdefault(path, fid)
+
+        # Image paths that still need a color, mapped to (tracking id, fingerprint)
+        pending: dict[str, tuple[str, str | None]] = {}
+        changed_ids: set[str] = set()
+
         # Process each image file
         for image_path in image_files:
             total_images += 1
 
             # Find the tracking entry for this file
-            file_id = None
-            for fid, file_info in tracking_data.items():
-                if file_info.get("path") == str(image_path):
-                    file_id = fid
-                    break
+            path_str = str(image_path)
+            file_id = path_to_id.get(path_str)
 
             # If not in tracking, create a new entry
             if file_id is None:
                 file_id = f"local_file_{total_images}"
                 tracking_data[file_id] = {
-                    "path": str(image_path),
+                    "path": path_str,
                     "modified_time": "",
                     "size": 0,
                     "local_sync_time": "2025-06-28T00:00:00.000000",
                 }
+                path_to_id[path_str] = file_id
 
-            # Check if we need to compute the color
-            existing_color = tracking_data[file_id].get("complementary_color")
-            if existing_color and existing_color != "#000000":
+            # Size and mtime identify the file contents the color was computed from
+            try:
+                st = os.stat(path_str)
+                fingerprint = f"{st.st_size}:{st.st_mtime_ns}"
+            except OSError:
+                fingerprint = None
+
+            # Check if we need to compute the color; a file replaced in place
+            # keeps its path but gets a new fingerprint
+            file_info = tracking_data[file_id]
+            existing_color = file_info.get("complementary_color")
+            stored_fingerprint = file_info.get("color_fingerprint")
+            if (
+                existing_color
+                and existing_color != "#000000"
+                and stored_fingerprint in (None, fingerprint)
+            ):
                 logger.debug(
                     f"Complementary color already exists for {image_path.name}: {existing_color}"
                 )
+                if stored_fingerprint is None and fingerprint is not None:
+                    # Entries from before fingerprints existed adopt the current one
+                    file_info["color_fingerprint"] = fingerprint
+                    changed_ids.add(file_id)
                 continue
 
-            # Compute the color
+            pending[path_str] = (file_id, fingerprint)
+
+        # Images whose content already has a color (a copy under another
+        # path, or a file that was only touched) reuse it
+        known_colors = color_index(tracking_data)
+        content_keys: dict[str, str] = {}
+        results: list[tuple[str, str]] = []
+        to_compute: list[str] = []
+        for path_str in pending:
             try:
-                complementary_color = self._get_complementary_color(image_path)
-                tracking_data[file_id]["complementary_color"] = complementary_color
-                updated_count += 1
-                logger.info(
-                    f"Computed complementary color for {image_path.name}: {complementary_color}"
-                )
-            except Exception as e:
-                logger.warning(
-                    f"Failed to compute complementary color for {image_path.name}: {e}"
-                )
-                tracking_data[file_id]["complementary_color"] = "#000000"
+                content_keys[path_str] = content_key(path_str)
+            except OSError as e:
+                logger.debug(f"Could not fingerprint {path_str}: {e}")
+            known_color = known_colors.get(content_keys.get(path_str, ""))
+            if known_color:
+                results.append((path_str, known_color))
+            else:
+                to_compute.append(path_str)
+
+        # Compute the missing colors, then record them
+        results.extend(self._compute_colors(to_compute))
+        for path_str, complementary_color in results:
+            file_id, fingerprint = pending[path_str]
+            file_info = tracking_data[file_id]
+            file_info["complementary_color"] = complementary_color
+            if fingerprint is not None:
+                file_info["color_fingerprint"] = fingerprint
+            if path_str in content_keys:
+                file_info["content_key"] = content_keys[path_str]
+            changed_ids.add(file_id)
+            updated_count += 1
+            logger.info(
+                f"Computed complementary color for {Path(path_str).name}: {complementary_color}"
+            )
 
         # Save updated tracking data
+        self._persist_changes(tracking_data, changed_ids)
         if updated_count > 0:
-            self._save_tracking_data(tracking_data)
             logger.info(f"Updated {updated_count} files with complementary colors")
         else:
             logger.info("No new complementary colors to compute")
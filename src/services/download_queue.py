@@ -2,19 +2,40 @@
 Download queue management module for handling concurrent downloads with bandwidth limiting.
 """
 
+import itertools
 import logging
 import threading
-import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
-from queue import Empty, Queue
+from queue import Empty, PriorityQueue
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Drive's error reasons for exceeding the per-user request quota
+_RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
 
-@dataclass
+
+def _is_rate_limited(error: BaseException | None) -> bool:
+    """Return True if an error, or one it was raised from, is a rate limit.
+
+    Recognizes HTTP 429 and Drive's 403 rate-limit responses, as raised by
+    the Google API client.
+    """
+    while error is not None:
+        status = getattr(getattr(error, "resp", None), "status", None)
+        if status == 429:
+            return True
+        if status == 403 and any(
+            reason in str(error) for reason in _RATE_LIMIT_REASONS
+        ):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+@dataclass(slots=True)
 class DownloadTask:
     """Represents a download task in the queue."""
 
@@ -34,16 +55,23 @@ class DownloadQueue:
     """Manages concurrent downloads with bandwidth limiting."""
 
     def __init__(
-        self, max_workers: int = 3, max_retries: int = 3, retry_delay_seconds: int = 5
+        self,
+        max_workers: int = 3,
+        max_retries: int = 3,
+        retry_delay_seconds: int = 5,
     ):
         """Initialize the download queue.
 
         Args:
             max_workers: Maximum number of concurrent downloads
             max_retries: Number of retry attempts for failed downloads
-            retry_delay_seconds: Delay between retry attempts in seconds
+            retry_delay_seconds: Delay between retry attempts in seconds;
+                doubled for each further attempt after a rate-limit error
         """
-        self.queue: Queue[DownloadTask] = Queue()
+        # Entries are (-priority, sequence, task): higher priority first,
+        # arrival order within a priority level
+        self.queue: PriorityQueue[tuple[int, int, DownloadTask]] = PriorityQueue()
+        self._sequence = itertools.count()
         self.max_workers = max_workers
         self.max_retries = max_retries
         self.retry_delay_seconds = retry_delay_seconds
@@ -64,14 +92,18 @@ class DownloadQueue:
         """Main worker loop that processes download tasks."""
         while not self.stop_event.is_set():
             try:
-                task = self.queue.get(timeout=1)
+                _, _, task = self.queue.get(timeout=1)
+                if self.stop_event.is_set():
+                    # stop() discards queued work; don't start a new download
+                    self.queue.task_done()
+                    break
                 try:
                     self._process_task(task)
                 except Exception as e:
                     logger.error(
                         f"Error processing task for file {task.file_id}: {str(e)}"
                     )
-                    self._handle_task_error(task, str(e))
+                    self._handle_task_error(task, str(e), _is_rate_limited(e))
                 finally:
                     self.queue.task_done()
             except Empty:
@@ -90,7 +122,9 @@ class DownloadQueue:
             task.last_error = str(e)
             raise
 
-    def _handle_task_error(self, task: DownloadTask, error: str) -> None:
+    def _handle_task_error(
+        self, task: DownloadTask, error: str, rate_limited: bool = False
+    ) -> None:
         """Handle errors that occur during task processing."""
         task.last_error = error
         task.retry_count += 1
@@ -99,23 +133,18 @@ class DownloadQueue:
             logger.info(
                 f"Retrying task for file {task.file_id} (attempt {task.retry_count + 1})"
             )
-            time.sleep(self.retry_delay_seconds)
-            # Create a new task to ensure clean state
-            new_task = DownloadTask(
-                file_id=task.file_id,
-                destination_path=task.destination_path,
-                size_bytes=task.size_bytes,
-                created_time=task.created_time,
-                priority=task.priority,
-                retry_count=task.retry_count,
-                download_callback=task.download_callback,
-                error_callback=task.error_callback,
-                last_error=task.last_error,
-                file_metadata=task.file_metadata,
-            )
-            self.queue.put(new_task)
+            # Wait out the retry delay, but give up at once on shutdown. Back
+            # off exponentially on rate limits, so workers hitting Drive's
+            # per-user quota don't retry in lockstep.
+            delay = self.retry_delay_seconds
+            if rate_limited:
+                delay *= 2 ** (task.retry_count - 1)
+            if self.stop_event.wait(delay):
+                return
+            # Requeue the same task; its retry state was updated above
+            self._enqueue(task)
             with self._lock:
-                self._active_tasks[task.file_id] = new_task
+                self._active_tasks[task.file_id] = task
         else:
             logger.error(
                 f"Task for file {task.file_id} failed after {task.retry_count} attempts"
@@ -125,6 +154,10 @@ class DownloadQueue:
             with self._lock:
                 self._active_tasks.pop(task.file_id, None)
 
+    def _enqueue(self, task: DownloadTask) -> None:
+        """Put a task on the queue according to its priority."""
+        self.queue.put((-task.priority, next(self._sequence), task))
+
     def add_task(
         self,
         file_id: str,
@@ -163,37 +196,42 @@ class DownloadQueue:
                 logger.warning(f"Task for file {file_id} already exists")
                 return
             self._active_tasks[file_id] = task
-        self.queue.put(task)
+        self._enqueue(task)
         logger.debug(f"Added download task for {destination_path} to queue")
 
     def stop(self) -> None:
         """Stop all worker threads and clear the queue."""
-        print("DownloadQueue: Setting stop event")
+        logger.debug("DownloadQueue: Setting stop event")
         self.stop_event.set()
 
-        print("DownloadQueue: Waiting for worker threads")
+        logger.debug("DownloadQueue: Waiting for worker threads")
         for worker in self.workers:
-            print(f"DownloadQueue: Waiting for thread {worker.name}")
+            logger.debug(f"DownloadQueue: Waiting for thread {worker.name}")
             worker.join(timeout=1.0)
             if worker.is_alive():
-                print(f"DownloadQueue: Thread {worker.name} did not stop in time")
+                logger.debug(
+                    f"DownloadQueue: Thread {worker.name} did not stop in time"
+                )
                 # Force clear the queue to help threads exit
-                while not self.queue.empty():
-                    try:
-                        self.queue.get_nowait()
-                        self.queue.task_done()
-                    except Empty:
-                        break
-
-        print("DownloadQueue: Clearing queue")
-        while not self.queue.empty():
-            try:
-                self.queue.get_nowait()
-                self.queue.task_done()
-            except Empty:
-                break
-        self._active_tasks.clear()
-        print("DownloadQueue: Stop complete")
+                self._drain_queue()
+
+        logger.debug("DownloadQueue: Clearing queue")
+        self._drain_queue()
+        with self._lock:
+            self._active_tasks.clear()
+        logger.debug("DownloadQueue: Stop complete")
+
+    def _drain_queue(self) -> None:
+        """Discard all queued tasks at once and release anyone waiting on join()."""
+        with self.queue.mutex:
+            discarded = len(self.queue.queue)
+            self.queue.queue.clear()
+            self.queue.unfinished_tasks = max(
+                0, self.queue.unfinished_tasks - discarded
+            )
+            if self.queue.unfinished_tasks == 0:
+                self.queue.all_tasks_done.notify_all()
+            self.queue.not_full.notify_all()
 
     def get_queue_size(self) -> int:
         """Get the current number of tasks in the queue."""
@@ -0,0 +1,236 @@
+"""
+Shared storage helpers for the media file tracking data.
+
+The tracking JSON is read by the Google Drive sync, the complementary color
+service and the slideshow. Small updates can be appended to a journal next to
+it (one JSON object per line) instead of rewriting the whole file; readers
+fold the journal in on load. Compaction folds the journal on disk into the
+tracking file, so writers only ever record their changes through the journal
+and never overwrite each other's updates.
+
+Entries may carry a ``content_key`` fingerprint of the image they describe, so
+a complementary color computed once can be reused for identical content.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+# Prefer orjson for the tracking file when it is available
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def serialize_tracking(data: Any, indent: bool = True) -> bytes:
+        """Serialize tracking data as JSON bytes, indented unless told not to."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+
+    def _dumps_line(data: Any) -> bytes:
+        return orjson.dumps(data)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def serialize_tracking(data: Any, indent: bool = True) -> bytes:
+        """Serialize tracking data as JSON bytes, indented unless told not to."""
+        if indent:
+            return json.dumps(data, indent=2).encode("utf-8")
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    def _dumps_line(data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+# xxHash fingerprints file content faster than hashlib when it is installed
+try:
+    import xxhash
+
+    def _digest(data: bytes) -> str:
+        return xxhash.xxh3_64(data).hexdigest()
+
+except ImportError:
+
+    def _digest(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+logger = logging.getLogger(__name__)
+
+# Bytes read from each end of a file to fingerprint its content
+_CONTENT_KEY_SPAN = 64 * 1024
+
+# One lock per tracking file, shared by every service that writes it
+_file_locks: dict[str, threading.Lock] = {}
+_file_locks_guard = threading.Lock()
+
+
+def _tracking_lock(tracking_file: str | Path) -> threading.Lock:
+    """Return the lock that serializes writes to a tracking file."""
+    key = os.path.abspath(tracking_file)
+    with _file_locks_guard:
+        lock = _file_locks.get(key)
+        if lock is None:
+            lock = _file_locks[key] = threading.Lock()
+        return lock
+
+
+def journal_path(tracking_file: str | Path) -> Path:
+    """Return the journal file that belongs to a tracking file."""
+    return Path(f"{tracking_file}.log")
+
+
+def load_tracking(tracking_file: str | Path) -> dict[str, Any]:
+    """Load tracking data and apply any journaled updates.
+
+    Args:
+        tracking_file: Path to the tracking JSON file
+
+    Returns:
+        Tracking data keyed by file id
+
+    Raises:
+        ValueError: If the tracking file is not valid JSON
+    """
+    tracking_file = Path(tracking_file)
+    try:
+        data: dict[str, Any] = dict(_json_loads(tracking_file.read_bytes()))
+    except FileNotFoundError:
+        data = {}
+    return _apply_journal(tracking_file, data)
+
+
+def _apply_journal(tracking_file: Path, data: dict[str, Any]) -> dict[str, Any]:
+    """Apply the journaled updates of a tracking file to ``data`` in place."""
+    try:
+        journal = journal_path(tracking_file).read_bytes()
+    except FileNotFoundError:
+        return data
+
+    for line in journal.splitlines():
+        if not line.strip():
+            continue
+        try:
+            changes = _json_loads(line)
+        except ValueError:
+            # A torn final line from an interrupted append
+            logger.debug(f"Skipping unreadable journal line for {tracking_file}")
+            continue
+        for file_id, file_info in changes.items():
+            if file_info is None:
+                data.pop(file_id, None)
+            else:
+                data[file_id] = file_info
+    return data
+
+
+def append_tracking(tracking_file: str | Path, changes: dict[str, Any]) -> None:
+    """Append updated entries to the journal in a single write.
+
+    Args:
+        tracking_file: Path to the tracking JSON file
+        changes: Full entries keyed by file id; None marks a removed entry
+    """
+    if not changes:
+        return
+    # Lead with a newline so a torn line from an interrupted append can't
+    # swallow the first new record
+    payload = b"\n" + b"".join(
+        _dumps_line({file_id: file_info}) + b"\n"
+        for file_id, file_info in changes.items()
+    )
+    journal = journal_path(tracking_file)
+    with _tracking_lock(tracking_file):
+        # The media directory may have been wiped since the tracking was loaded
+        journal.parent.mkdir(parents=True, exist_ok=True)
+        with open(journal, "ab") as f:
+            f.write(payload)
+
+
+def compact_tracking(tracking_file: str | Path, indent: bool = True) -> dict[str, Any]:
+    """Fold the journal into the tracking file and remove it.
+
+    Works from what is on disk rather than any caller's copy of the data, so
+    updates other services journaled are kept. A tracking file that is not
+    valid JSON is replaced by the journaled entries alone.
+
+    Args:
+        tracking_file: Path to the tracking JSON file
+        indent: Whether to indent the rewritten JSON
+
+    Returns:
+        The compacted tracking data
+
+    Raises:
+        OSError: If the tracking file can't be written
+    """
+    tracking_file = Path(tracking_file)
+    with _tracking_lock(tracking_file):
+        tracking_file.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            data: dict[str, Any] = dict(_json_loads(tracking_file.read_bytes()))
+        except FileNotFoundError:
+            data = {}
+        except ValueError:
+            logger.warning(f"Replacing unreadable tracking file {tracking_file}")
+            data = {}
+        _apply_journal(tracking_file, data)
+
+        # Write a temp file and swap it in, so a crash leaves either the old
+        # or the new tracking data and never a partial file
+        tmp_file = Path(f"{tracking_file}.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(serialize_tracking(data, indent=indent))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, tracking_file)
+        # Everything in the journal is now part of the tracking file
+        journal_path(tracking_file).unlink(missing_ok=True)
+    return data
+
+
+def journal_size(tracking_file: str | Path) -> int:
+    """Return the journal size in bytes, or 0 if there is none."""
+    try:
+        return journal_path(tracking_file).stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def content_key(path: str | Path) -> str:
+    """Fingerprint a file from its size and its first and last 64 KiB.
+
+    Cheap enough to run on every download while still telling apart photos
+    that merely share a name.
+
+    Raises:
+        OSError: If the file can't be read
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= 2 * _CONTENT_KEY_SPAN:
+            data = f.read()
+        else:
+            data = f.read(_CONTENT_KEY_SPAN)
+            f.seek(-_CONTENT_KEY_SPAN, os.SEEK_END)
+            data += f.read()
+    return f"{size}-{_digest(data)}"
+
+
+def color_index(data: dict[str, Any]) -> dict[str, str]:
+    """Map content keys to the complementary colors recorded for them.
+
+    Entries without a content key, or whose color extraction failed, are
+    left out.
+    """
+    return {
+        file_info["content_key"]: color
+        for file_info in data.values()
+        if file_info.get("content_key")
+        and (color := file_info.get("complementary_color"))
+        and color != "#000000"
+    }
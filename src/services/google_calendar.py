@@ -2,8 +2,11 @@
 Google Calendar service module for handling calendar operations and synchronization.
 """
 
+import copy
 import logging
 import os
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Any, cast
 
@@ -18,6 +21,44 @@ from src.utils.error_handling import ErrorSeverity, FamilyCenterError, handle_er
 
 logger = logging.getLogger(__name__)
 
+# Only the event fields the calendar views use are requested
+_EVENT_FIELDS = "items(id,summary,start,end,location,description),nextPageToken"
+
+# Recent list results, keyed by
+# (calendar_id, service, time_min, time_max, max_results)
+_EVENTS_CACHE_TTL_SECONDS = 60.0
+_EVENTS_CACHE_MAX_ENTRIES = 64
+_events_cache: dict[tuple[Any, ...], tuple[float, list[dict[str, Any]]]] = {}
+_events_cache_lock = threading.Lock()
+
+
+def _cached_events(key: tuple[Any, ...]) -> list[dict[str, Any]] | None:
+    """Return a deep copy of cached events for ``key`` if they are still fresh."""
+    with _events_cache_lock:
+        cached = _events_cache.get(key)
+        if cached is None:
+            return None
+        if time.monotonic() - cached[0] > _EVENTS_CACHE_TTL_SECONDS:
+            del _events_cache[key]
+            return None
+        return copy.deepcopy(cached[1])
+
+
+def _cache_events(key: tuple[Any, ...], events: list[dict[str, Any]]) -> None:
+    """Remember a copy of a list result, evicting the oldest entry when full."""
+    with _events_cache_lock:
+        if key not in _events_cache and len(_events_cache) >= _EVENTS_CACHE_MAX_ENTRIES:
+            oldest = min(_events_cache, key=lambda k: _events_cache[k][0])
+            del _events_cache[oldest]
+        _events_cache[key] = (time.monotonic(), copy.deepcopy(events))
+
+
+def _invalidate_events_cache(calendar_id: str) -> None:
+    """Drop cached list results for a calendar after it is modified."""
+    with _events_cache_lock:
+        for key in [k for k in _events_cache if k[0] == calendar_id]:
+            del _events_cache[key]
+
 
 class GoogleCalendarError(FamilyCenterError):
     """Raised when there is an error with Google Calendar."""
@@ -89,36 +130,101 @@ class GoogleCalendarService:
         Returns:
             List of event metadata dictionaries
         """
-        if self.use_ical:
-            return cast(
-                list[dict[str, Any]],
-                self.ical_service.list_events(
-                    max_results=max_results,
-                    time_min=time_min,
-                    time_max=time_max,
-                ),
-            )
+        return self._list_event_windows([(time_min, time_max)], max_results)[0]
 
-        if time_min is None:
-            time_min = datetime.utcnow()
-        if time_max is None:
-            time_max = time_min + timedelta(days=7)
+    @handle_error(severity=ErrorSeverity.ERROR)
+    def list_events_multi(
+        self,
+        windows: list[tuple[datetime | None, datetime | None]],
+        max_results: int | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """List events for several time windows in one round trip.
 
-        events_result = (
-            self.service.events()
-            .list(
+        With the Calendar API the queries are sent as a single batch request.
+
+        Args:
+            windows: (time_min, time_max) pairs; None values get the same
+                defaults as list_events
+            max_results: Maximum number of events to return per window
+
+        Returns:
+            One list of event metadata dictionaries per window, in order
+        """
+        return self._list_event_windows(windows, max_results)
+
+    def _list_event_windows(
+        self,
+        windows: list[tuple[datetime | None, datetime | None]],
+        max_results: int | None,
+    ) -> list[list[dict[str, Any]]]:
+        """Fetch events for each window, batching Calendar API calls."""
+        if self.use_ical:
+            return [
+                cast(
+                    list[dict[str, Any]],
+                    self.ical_service.list_events(
+                        max_results=max_results,
+                        time_min=time_min,
+                        time_max=time_max,
+                    ),
+                )
+                for time_min, time_max in windows
+            ]
+
+        results: list[list[dict[str, Any]] | None] = []
+        missing: list[tuple[int, tuple[Any, ...], Any]] = []
+        for time_min, time_max in windows:
+            # Key on the caller's arguments so default windows are cached too
+            key = (self.calendar_id, self.service, time_min, time_max, max_results)
+            cached = _cached_events(key)
+            results.append(cached)
+            if cached is not None:
+                continue
+
+            if time_min is None:
+                time_min = datetime.utcnow()
+            if time_max is None:
+                time_max = time_min + timedelta(days=7)
+            request = self.service.events().list(
                 calendarId=self.calendar_id,
                 timeMin=time_min.isoformat() + "Z",
                 timeMax=time_max.isoformat() + "Z",
                 maxResults=max_results,
                 singleEvents=True,
                 orderBy="startTime",
+                fields=_EVENT_FIELDS,
             )
-            .execute()
-        )
-
-        events = events_result.get("items", [])
-        return cast(list[dict[str, Any]], events)
+            missing.append((len(results) - 1, key, request))
+
+        if len(missing) == 1:
+            index, key, request = missing[0]
+            events = request.execute().get("items", [])
+            results[index] = events
+            _cache_events(key, events)
+        elif missing:
+            errors: list[Exception] = []
+
+            def store_result(
+                request_id: str, response: dict[str, Any], exception: Exception | None
+            ) -> None:
+                if exception is not None:
+                    errors.append(exception)
+                    return
+                index, key, _ = missing[int(request_id)]
+                events = response.get("items", [])
+                results[index] = events
+                _cache_events(key, events)
+
+            batch = self.service.new_batch_http_request(callback=store_result)
+            for i, (_, _, request) in enumerate(missing):
+                batch.add(request, request_id=str(i))
+            batch.execute()
+
+            # Surface failures the same way a single list() call would
+            if errors:
+                raise errors[0]
+
+        return cast(list[list[dict[str, Any]]], results)
 
 
 @handle_error()
@@ -163,6 +269,11 @@ def list_events(
     Raises:
         GoogleCalendarError: If listing events fails.
     """
+    key = (calendar_id, service, time_min, time_max, max_results)
+    cached = _cached_events(key)
+    if cached is not None:
+        return cached
+
     try:
         if time_min is None:
             time_min = datetime.utcnow()
@@ -178,10 +289,13 @@ def list_events(
                 maxResults=max_results,
                 singleEvents=True,
                 orderBy="startTime",
+                fields=_EVENT_FIELDS,
             )
             .execute()
         )
-        return cast(list[dict[str, Any]], events_result.get("items", []))
+        events = cast(list[dict[str, Any]], events_result.get("items", []))
+        _cache_events(key, events)
+        return events
     except HttpError as error:
         logger.error(f"Failed to list events: {error}")
         raise GoogleCalendarError(f"Failed to list events: {str(error)}") from error
@@ -208,6 +322,7 @@ def create_event(
     """
     try:
         event = service.events().insert(calendarId=calendar_id, body=event).execute()
+        _invalidate_events_cache(calendar_id)
         return event
     except HttpError as error:
         logger.error(f"Failed to create event: {error}")
@@ -241,6 +356,7 @@ def update_event(
             .update(calendarId=calendar_id, eventId=event_id, body=event)
             .execute()
         )
+        _invalidate_events_cache(calendar_id)
         return event
     except HttpError as error:
         logger.error(f"Failed to update event: {error}")
@@ -265,6 +381,7 @@ def delete_event(
     """
     try:
         service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
+        _invalidate_events_cache(calendar_id)
     except HttpError as error:
         logger.error(f"Failed to delete event: {error}")
         raise GoogleCalendarError(f"Failed to delete event: {str(error)}") from error
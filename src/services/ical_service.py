@@ -2,19 +2,37 @@
 iCal service module for handling calendar operations and synchronization.
 """
 
+import asyncio
+import heapq
 import logging
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Any, cast
+from typing import Any
 
 import pytz
 import requests
 from icalendar import Calendar
 
+# aiohttp lets list_events_async share an event loop with other feeds
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # type: ignore[assignment]
+
 from src.config import Config
-from src.utils.error_handling import ErrorSeverity, FamilyCenterError, handle_error
+from src.utils.error_handling import (
+    ErrorSeverity,
+    FamilyCenterError,
+    handle_error,
+    log_error,
+)
 
 logger = logging.getLogger(__name__)
 
+# list_events results remembered per parsed feed
+_MAX_CACHED_RESULTS = 32
+
 
 class ICalError(FamilyCenterError):
     """Raised when there is an error with iCal operations."""
@@ -31,6 +49,46 @@ class ICalError(FamilyCenterError):
         super().__init__(message, severity)
 
 
+@dataclass(slots=True)
+class _EventRecord:
+    """The VEVENT fields list_events needs; a missing time is None."""
+
+    start: date | None
+    end: date | None
+    uid: str
+    summary: str
+    description: str
+    location: str
+
+
+def _records_from_calendar(cal: Calendar) -> list[_EventRecord]:
+    """Collect the event fields from a feed parsed by icalendar."""
+    records = []
+    for event in cal.walk("VEVENT"):
+        start = event.get("dtstart")
+        end = event.get("dtend")
+        records.append(
+            _EventRecord(
+                start=start.dt if start is not None else None,
+                end=end.dt if end is not None else None,
+                uid=str(event.get("uid")),
+                summary=str(event.get("summary", "")),
+                description=str(event.get("description", "")),
+                location=str(event.get("location", "")),
+            )
+        )
+    return records
+
+
+def _parse_feed(data: bytes) -> list[_EventRecord]:
+    """Parse a feed and collect its events.
+
+    Raises:
+        ValueError: If the feed is not valid iCalendar data
+    """
+    return _records_from_calendar(Calendar.from_ical(data))
+
+
 class ICalService:
     """Service class for iCal operations."""
 
@@ -45,6 +103,17 @@ class ICalService:
         self.timezone = config.get("google_calendar.timezone")
         self.tz = pytz.timezone(self.timezone)
 
+        # Validators and parse of the last fetched feed, so an unchanged feed
+        # is answered with 304 Not Modified and not parsed again
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._cached_records: list[_EventRecord] | None = None
+        # list_events results for the cached feed, by arguments
+        self._cached_events: dict[tuple[Any, ...], list[dict[str, Any]]] = {}
+        # aiohttp session for list_events_async and the loop it belongs to
+        self._session: Any = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+
     def _convert_to_timezone(self, dt: datetime | date) -> datetime:
         """Convert datetime to configured timezone."""
         if isinstance(dt, date) and not isinstance(dt, datetime):
@@ -64,6 +133,188 @@ class ICalService:
             return {"date": dt.strftime("%Y-%m-%d")}
         return {"dateTime": dt.isoformat(), "timeZone": self.timezone}
 
+    def _iter_events(
+        self,
+        records: list[_EventRecord],
+        time_min: datetime | None,
+        time_max: datetime | None,
+    ) -> Iterator[tuple[tuple[int, str], int, dict[str, Any]]]:
+        """Yield the feed's events that fall inside the time window.
+
+        Each event comes with its sort key (regular events before all-day
+        events, then by start time) and its position in the feed, which
+        keeps the order of equal keys stable.
+        """
+        # Bind loop invariants once
+        convert = self._convert_to_timezone
+        format_time = self._format_event_time
+        one_day = timedelta(days=1)
+
+        for position, record in enumerate(records):
+            # Get event start time
+            start = record.start
+
+            # Determine if this is an all-day event
+            is_all_day = isinstance(start, date) and not isinstance(start, datetime)
+
+            # Convert to datetime if needed
+            start = convert(start)
+
+            # Filter on the start before doing any work on the end time
+            if time_min and start < time_min:
+                continue
+
+            end = convert(record.end)
+
+            # For all-day events, iCal uses exclusive end dates
+            # Convert to inclusive end dates by subtracting one day
+            if is_all_day:
+                end = end - one_day
+
+            if time_max and end > time_max:
+                continue
+
+            # Convert to dictionary format matching Google Calendar API
+            start_time = format_time(start, is_all_day)
+            event_dict: dict[str, Any] = {
+                "id": record.uid,
+                "summary": record.summary,
+                "start": start_time,
+                "end": format_time(end, is_all_day),
+                "description": record.description,
+                "location": record.location,
+            }
+
+            # Add all-day event flag
+            if is_all_day:
+                event_dict["allDay"] = True
+                sort_key = (1, start_time["date"])
+            else:
+                sort_key = (0, start_time["dateTime"])
+
+            yield sort_key, position, event_dict
+
+    def _conditional_headers(self) -> dict[str, str]:
+        """Return the validators of the cached feed as request headers."""
+        headers = {}
+        if self._cached_records is not None:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+        return headers
+
+    def _store_feed(
+        self, records: list[_EventRecord], headers: Mapping[str, str]
+    ) -> tuple[list[_EventRecord], dict[tuple[Any, ...], list[dict[str, Any]]]]:
+        """Cache a freshly parsed feed along with its validators."""
+        events: dict[tuple[Any, ...], list[dict[str, Any]]] = {}
+        self._cached_records = records
+        self._cached_events = events
+        self._etag = headers.get("ETag")
+        self._last_modified = headers.get("Last-Modified")
+        return records, events
+
+    def _fetch_feed(
+        self,
+    ) -> tuple[list[_EventRecord], dict[tuple[Any, ...], list[dict[str, Any]]]]:
+        """Fetch and parse the feed, reusing the last parse if it is unchanged.
+
+        Returns:
+            The feed's events and the list_events results cached for them
+
+        Raises:
+            requests.RequestException: If the feed can't be fetched
+        """
+        response = requests.get(
+            self.ical_url, headers=self._conditional_headers(), timeout=30
+        )
+        records = self._cached_records
+        if response.status_code == 304 and records is not None:
+            logger.debug("iCal feed not modified, reusing the parsed events")
+            return records, self._cached_events
+        response.raise_for_status()
+
+        # Parse the raw bytes; response.text would first have requests
+        # guess the charset over the whole feed if the server sent none
+        return self._store_feed(_parse_feed(response.content), response.headers)
+
+    async def _fetch_feed_async(
+        self,
+    ) -> tuple[list[_EventRecord], dict[tuple[Any, ...], list[dict[str, Any]]]]:
+        """Async counterpart of _fetch_feed using the service's aiohttp session.
+
+        Raises:
+            aiohttp.ClientError: If the feed can't be fetched
+            TimeoutError: If the feed takes longer than 30 seconds
+        """
+        session = self._get_session()
+        async with session.get(
+            self.ical_url,
+            headers=self._conditional_headers(),
+            timeout=aiohttp.ClientTimeout(total=30),
+        ) as response:
+            records = self._cached_records
+            if response.status == 304 and records is not None:
+                logger.debug("iCal feed not modified, reusing the parsed events")
+                return records, self._cached_events
+            response.raise_for_status()
+            content = await response.read()
+            headers = response.headers
+
+        # Parse in a worker thread so other feeds keep downloading meanwhile
+        records = await asyncio.get_running_loop().run_in_executor(
+            None, _parse_feed, content
+        )
+        return self._store_feed(records, headers)
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the aiohttp session, opening one for the running event loop."""
+        loop = asyncio.get_running_loop()
+        session = self._session
+        if session is None or session.closed or self._session_loop is not loop:
+            session = aiohttp.ClientSession()
+            self._session = session
+            self._session_loop = loop
+        return session
+
+    async def close(self) -> None:
+        """Close the aiohttp session opened by list_events_async, if any."""
+        session = self._session
+        self._session = None
+        self._session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    def _select_events(
+        self,
+        records: list[_EventRecord],
+        cached_events: dict[tuple[Any, ...], list[dict[str, Any]]],
+        max_results: int | None,
+        time_min: datetime | None,
+        time_max: datetime | None,
+    ) -> list[dict[str, Any]]:
+        """Pick the events for a query, answering repeats from the cache."""
+        # The same query against an unchanged feed has the same answer
+        key = (max_results, time_min, time_max)
+        cached = cached_events.get(key)
+        if cached is not None:
+            return list(cached)
+
+        # Keep only the earliest events on a bounded heap rather than
+        # sorting every event in the window
+        events = self._iter_events(records, time_min, time_max)
+        if max_results:
+            selected = heapq.nsmallest(max_results, events)
+        else:
+            selected = sorted(events)
+
+        result = [event for _, _, event in selected]
+        if len(cached_events) >= _MAX_CACHED_RESULTS:
+            cached_events.clear()
+        cached_events[key] = result
+        return list(result)
+
     @handle_error(severity=ErrorSeverity.ERROR)
     def list_events(
         self,
@@ -71,76 +322,53 @@ class ICalService:
         time_min: datetime | None = None,
         time_max: datetime | None = None,
     ) -> list[dict[str, Any]]:
-        """List events from the iCal feed."""
+        """List events from the iCal feed.
+
+        Events are ordered by start time, regular events before all-day
+        events; with ``max_results`` the earliest events are returned.
+        """
         try:
             # Fetch iCal feed
-            response = requests.get(self.ical_url, timeout=30)
-            response.raise_for_status()
-
-            # Parse iCal feed
-            cal = Calendar.from_ical(response.text)
-
-            # Convert events to dictionary format
-            events = []
-            for event in cal.walk("VEVENT"):
-                # Get event start and end times
-                start = event.get("dtstart").dt
-                end = event.get("dtend").dt
-
-                # Determine if this is an all-day event
-                import datetime as dtmod
-
-                is_all_day = isinstance(start, dtmod.date) and not isinstance(
-                    start, dtmod.datetime
-                )
-
-                # Convert to datetime if needed
-                start = self._convert_to_timezone(start)
-                end = self._convert_to_timezone(end)
-
-                # For all-day events, iCal uses exclusive end dates
-                # Convert to inclusive end dates by subtracting one day
-                if is_all_day:
-                    end = end - timedelta(days=1)
-
-                # Apply time filters
-                if time_min and start < time_min:
-                    continue
-                if time_max and end > time_max:
-                    continue
-
-                # Convert to dictionary format matching Google Calendar API
-                event_dict: dict[str, str | dict[str, str] | bool] = {
-                    "id": str(event.get("uid")),
-                    "summary": str(event.get("summary", "")),
-                    "start": self._format_event_time(start, is_all_day),
-                    "end": self._format_event_time(end, is_all_day),
-                    "description": str(event.get("description", "")),
-                    "location": str(event.get("location", "")),
-                }
-
-                # Add all-day event flag
-                if is_all_day:
-                    event_dict["allDay"] = True
-
-                events.append(event_dict)
-
-                # Apply max results limit
-                if max_results and len(events) >= max_results:
-                    break
-
-            # Sort events by start time, with all-day events after regular events
-            def sort_key(event: dict[str, Any]) -> tuple[int, str]:
-                start = event["start"]
-                if "dateTime" in start:
-                    return (0, start["dateTime"])  # Regular events first
-                return (1, start["date"])  # All-day events second
-
-            events.sort(key=sort_key)
-
-            return cast(list[dict[str, Any]], events)
+            records, cached_events = self._fetch_feed()
+            return self._select_events(
+                records, cached_events, max_results, time_min, time_max
+            )
 
         except requests.RequestException as e:
-            raise ICalError(f"Failed to fetch iCal feed: {str(e)}") from e
+            raise ICalError(f"Failed to fetch iCal feed: {e}") from e
+        except Exception as e:
+            raise ICalError(f"Failed to parse iCal feed: {e}") from e
+
+    async def list_events_async(
+        self,
+        max_results: int | None = None,
+        time_min: datetime | None = None,
+        time_max: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """List events from the iCal feed without blocking the event loop.
+
+        Takes the same arguments and shares the feed cache with list_events.
+        Several feeds can be fetched concurrently with e.g.
+        ``await asyncio.gather(*(s.list_events_async() for s in services))``.
+        Without aiohttp, list_events runs in a worker thread instead.
+
+        Raises:
+            ICalError: If the feed can't be fetched or parsed
+        """
+        if aiohttp is None:
+            return await asyncio.to_thread(
+                self.list_events, max_results, time_min, time_max
+            )
+
+        try:
+            records, cached_events = await self._fetch_feed_async()
+            return self._select_events(
+                records, cached_events, max_results, time_min, time_max
+            )
+
+        except (TimeoutError, aiohttp.ClientError) as e:
+            log_error(f"Error in list_events_async: {e}", error=e)
+            raise ICalError(f"Failed to fetch iCal feed: {e}") from e
         except Exception as e:
-            raise ICalError(f"Failed to parse iCal feed: {str(e)}") from e
+            log_error(f"Error in list_events_async: {e}", error=e)
+            raise ICalError(f"Failed to parse iCal feed: {e}") from e
@@ -2,9 +2,11 @@
 Local folder synchronization service module.
 """
 
+import errno
 import logging
 import os
 import shutil
+from collections.abc import Iterator
 from pathlib import Path
 
 from src.config import Config
@@ -12,6 +14,34 @@ from src.utils.error_handling import FamilyCenterError
 
 logger = logging.getLogger(__name__)
 
+# Errors from copy_file_range that mean "use a regular copy instead"
+_COPY_RANGE_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP}
+)
+
+
+def _copy_file(source: str, dest: str, source_stat: os.stat_result) -> None:
+    """Copy a file's contents and timestamps.
+
+    Skips the permission and extended attribute copying ``shutil.copy2``
+    does. On Linux the data is moved with ``copy_file_range``, which lets
+    copy-on-write filesystems share extents instead of copying them; other
+    platforms and filesystems fall back to ``shutil.copyfile``.
+    """
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source, "rb") as src, open(dest, "wb") as dst:
+                while os.copy_file_range(src.fileno(), dst.fileno(), 1 << 30):
+                    pass
+            copied = True
+        except OSError as e:
+            if e.errno not in _COPY_RANGE_UNSUPPORTED:
+                raise
+    if not copied:
+        shutil.copyfile(source, dest)
+    os.utime(dest, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+
 
 class LocalSyncError(FamilyCenterError):
     """Base exception for local sync related errors."""
@@ -51,6 +81,52 @@ class LocalSyncService:
         ext = os.path.splitext(filename)[1].lower().lstrip(".")
         return ext in self.supported_formats
 
+    def _is_supported_name(self, name: str) -> bool:
+        """Check a bare file name against the supported formats.
+
+        Same result as ``_is_supported_file_type`` without the ``splitext``
+        call; leading dots don't start an extension.
+        """
+        dot = name.rfind(".")
+        if dot <= 0 or not name[:dot].lstrip("."):
+            return False
+        return name[dot + 1 :].lower() in self.supported_formats
+
+    def _walk_files(
+        self, root: str, supported_only: bool = True
+    ) -> Iterator[tuple[str, str, os.stat_result]]:
+        """Yield the files under a directory tree.
+
+        Walks with ``os.scandir`` so file types come from the directory
+        listing. Like ``Path.rglob``, symlinked directories are not descended
+        into, while symlinked files are included.
+
+        Args:
+            root: Directory to walk
+            supported_only: Only yield files of a supported type
+
+        Yields:
+            (path relative to ``root``, full path, stat result) tuples
+        """
+        stack = [(root, "")]
+        while stack:
+            directory, prefix = stack.pop()
+            subdirs = []
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append((entry.path, prefix + name + os.sep))
+                        elif (
+                            not supported_only or self._is_supported_name(name)
+                        ) and entry.is_file():
+                            yield prefix + name, entry.path, entry.stat()
+            except OSError as e:
+                logger.debug(f"Skipping unreadable directory {directory}: {e}")
+            # Visit subdirectories depth-first in listing order, as rglob does
+            stack.extend(reversed(subdirs))
+
     def sync_folder(self, source_dir: str, dest_dir: str) -> None:
         """Sync files from source directory to destination directory."""
         source_path = Path(source_dir)
@@ -62,39 +138,38 @@ class LocalSyncService:
         # Ensure destination directory exists
         dest_path.mkdir(parents=True, exist_ok=True)
 
-        # Get list of files in source and destination
+        # Map relative paths to (full path, stat) in source and destination;
+        # the stats from the walk serve every later comparison
         source_files = {
-            f.relative_to(source_path): f
-            for f in source_path.rglob("*")
-            if f.is_file() and self._is_supported_file_type(str(f))
+            rel_path: (path, st) for rel_path, path, st in self._walk_files(source_dir)
         }
         dest_files = {
-            f.relative_to(dest_path): f
-            for f in dest_path.rglob("*")
-            if f.is_file() and self._is_supported_file_type(str(f))
+            rel_path: (path, st) for rel_path, path, st in self._walk_files(dest_dir)
         }
 
         # Remove files that don't exist in source
-        for rel_path in set(dest_files.keys()) - set(source_files.keys()):
-            file_path = dest_files[rel_path]
+        for rel_path in dest_files.keys() - source_files.keys():
+            file_path = dest_files[rel_path][0]
             try:
-                file_path.unlink()
+                os.unlink(file_path)
                 logger.info(f"Removed {file_path}")
             except OSError as e:
                 logger.warning(f"Failed to remove {file_path}: {e}")
 
         # Copy or update files
-        for rel_path, source_file in source_files.items():
-            dest_file = dest_path / rel_path
+        created_dirs: set[str] = set()
+        for rel_path, (source_file, source_stat) in source_files.items():
+            dest_file = os.path.join(dest_dir, rel_path)
             try:
-                # Ensure parent directory exists
-                dest_file.parent.mkdir(parents=True, exist_ok=True)
                 # Copy if file doesn't exist or is different
-                if (
-                    not dest_file.exists()
-                    or source_file.stat().st_mtime > dest_file.stat().st_mtime
-                ):
-                    shutil.copy2(source_file, dest_file)
+                existing = dest_files.get(rel_path)
+                if existing is None or source_stat.st_mtime > existing[1].st_mtime:
+                    # Ensure parent directory exists
+                    parent = os.path.dirname(dest_file)
+                    if parent not in created_dirs:
+                        os.makedirs(parent, exist_ok=True)
+                        created_dirs.add(parent)
+                    _copy_file(source_file, dest_file, source_stat)
                     logger.info(f"Copied {source_file} to {dest_file}")
             except OSError as e:
                 logger.warning(f"Failed to copy {source_file}: {e}")
@@ -115,17 +190,15 @@ class LocalSyncService:
             LocalSyncError: If status check fails
         """
         try:
-            source = Path(source_path)
-            dest = Path(dest_path)
-            if not source.exists() or not dest.exists():
+            if not os.path.exists(source_path) or not os.path.exists(dest_path):
                 return {"to_add": [], "to_update": [], "to_remove": []}
             source_files = {
-                f.name: f.stat().st_mtime
-                for f in source.glob("**/*")
-                if f.is_file() and self._is_supported_file_type(str(f))
+                os.path.basename(rel_path): st.st_mtime
+                for rel_path, _, st in self._walk_files(source_path)
             }
             dest_files = {
-                f.name: f.stat().st_mtime for f in dest.glob("**/*") if f.is_file()
+                os.path.basename(rel_path): st.st_mtime
+                for rel_path, _, st in self._walk_files(dest_path, supported_only=False)
             }
             to_add = [name for name in source_files if name not in dest_files]
             to_update = [
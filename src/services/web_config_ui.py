@@ -6,8 +6,11 @@ including a visual region selector for choosing webpage sections to capture.
 """
 
 import asyncio
+import json
 import logging
+import os
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from flask import (
@@ -15,19 +18,784 @@ from flask import (
     Response,
     jsonify,
     redirect,
-    render_template_string,
     request,
     send_from_directory,
     url_for,
 )
 from flask_cors import CORS
+from jinja2 import Template
 
 from src.config.config_manager import ConfigManager
 from src.services.web_content_service import WebContentService, WebContentTarget
 
+# Prefer a production WSGI server over the Werkzeug development server
+try:
+    from waitress import serve
+
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+    serve = None
+
+# orjson serializes large nested payloads much faster than the json module
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+# Config dashboard page, compiled once per WebConfigUI
+DASHBOARD_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>Family Center Config Dashboard</title>
+    <link rel="stylesheet" href="{{ url_for('static', filename='dashboard.css') }}">
+</head>
+<body>
+    <div class="container">
+        <h1>Family Center Config Dashboard</h1>
+        <div id="message"></div>
+
+        <div class="tabs">
+            <div class="tab active" onclick="showTab('google-drive')">Google Drive</div>
+            <div class="tab" onclick="showTab('local-media')">Local Media</div>
+            <div class="tab" onclick="showTab('calendar')">Calendar</div>
+            <div class="tab" onclick="showTab('weather')">Weather</div>
+            <div class="tab" onclick="showTab('slideshow')">Slideshow</div>
+            <div class="tab" onclick="showTab('web-content')">Web Content</div>
+            <div class="tab" onclick="showTab('weighting')">Time Weighting</div>
+        </div>
+
+        <!-- Google Drive Section -->
+        <div id="google-drive" class="tab-content active">
+            <div class="section">
+                <h3>Google Drive Configuration</h3>
+
+                <!-- Credentials Upload Section -->
+                <div class="form-group">
+                    <label>Google Drive Service Account Credentials</label>
+                    <input type="file" id="google_drive_credentials_file" accept=".json" onchange="handleCredentialsUpload(event)">
+                    <div class="help-text">Upload your Google Drive service account JSON credentials file</div>
+                    <div id="credentials-status" style="margin-top: 10px;"></div>
+                </div>
+
+                <div class="form-group">
+                    <label>Current Credentials Path</label>
+                    <input type="text" id="google_drive_credentials_path" placeholder="credentials/service-account.json" readonly>
+                    <div class="help-text">Path to the current credentials file</div>
+                </div>
+
+                <div class="form-group">
+                    <button type="button" class="btn btn-primary" onclick="testGoogleDriveConnection()">Test Google Drive Connection</button>
+                    <div id="connection-test-result" style="margin-top: 10px;"></div>
+                </div>
+
+                <hr style="margin: 20px 0;">
+
+                <div class="form-group">
+                    <label>Shared Folder ID</label>
+                    <input type="text" id="google_drive_shared_folder_id" placeholder="Enter Google Drive folder ID">
+                    <div class="help-text">The ID of the Google Drive folder to sync</div>
+                </div>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label>Local Media Path</label>
+                        <input type="text" id="google_drive_local_media_path" placeholder="media/remote_drive">
+                    </div>
+                    <div class="form-group">
+                        <label>Sync Interval (minutes)</label>
+                        <input type="number" id="google_drive_sync_interval_minutes" min="1" max="1440">
+                    </div>
+                </div>
+                <div class="form-group">
+                    <label>Auto Sync on Startup</label>
+                    <select id="google_drive_auto_sync_on_startup">
+                        <option value="true">Yes</option>
+                        <option value="false">No</option>
+                    </select>
+                </div>
+            </div>
+        </div>
+
+        <!-- Local Media Network Access Section -->
+        <div id="local-media" class="tab-content">
+            <div class="section">
+                <h3>Local Media Network Access</h3>
+                <div class="form-group">
+                    <label>Network Sharing Enabled</label>
+                    <select id="local_media_network_enabled">
+                        <option value="true">Yes</option>
+                        <option value="false">No</option>
+                    </select>
+                    <div class="help-text">Enable network access to media folders</div>
+                </div>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label>HTTP Port</label>
+                        <input type="number" id="local_media_http_port" min="1024" max="65535" value="8081">
+                        <div class="help-text">Port for web-based file browser</div>
+                    </div>
+                    <div class="form-group">
+                        <label>SMB/CIFS Share Name</label>
+                        <input type="text" id="local_media_smb_share" placeholder="family_center_media">
+                        <div class="help-text">Windows/Mac network share name</div>
+                    </div>
+                </div>
+                <div class="form-group">
+                    <label>Media Folders to Share</label>
+                    <div id="media-folders-list">
+                        <div class="list-item">
+                            <div class="form-row">
+                                <div class="form-group">
+                                    <label>Folder Path</label>
+                                    <input type="text" value="media/remote_drive" readonly>
+                                </div>
+                                <div class="form-group">
+                                    <label>Access URL</label>
+                                    <input type="text" value="http://localhost:8081/remote_drive" readonly>
+                                </div>
+                            </div>
+                            <div class="help-text">Google Drive synced media</div>
+                        </div>
+                        <div class="list-item">
+                            <div class="form-row">
+                                <div class="form-group">
+                                    <label>Folder Path</label>
+                                    <input type="text" value="media/web_news" readonly>
+                                </div>
+                                <div class="form-group">
+                                    <label>Access URL</label>
+                                    <input type="text" value="http://localhost:8081/web_news" readonly>
+                                </div>
+                            </div>
+                            <div class="help-text">Web content screenshots</div>
+                        </div>
+                        <div class="list-item">
+                            <div class="form-row">
+                                <div class="form-group">
+                                    <label>Folder Path</label>
+                                    <input type="text" value="media/Weather" readonly>
+                                </div>
+                                <div class="form-group">
+                                    <label>Access URL</label>
+                                    <input type="text" value="http://localhost:8081/Weather" readonly>
+                                </div>
+                            </div>
+                            <div class="help-text">Weather images and forecasts</div>
+                        </div>
+                    </div>
+                </div>
+                <div class="form-group">
+                    <label>Network Access Instructions</label>
+                    <div style="background: #f8f9fa; padding: 1em; border-radius: 4px; font-size: 14px;">
+                        <p><strong>Web Browser Access:</strong></p>
+                        <ul>
+                            <li>From any device on your network: <code>http://[RASPBERRY_PI_IP]:8081</code></li>
+                            <li>Browse folders and download files directly</li>
+                        </ul>
+                        <p><strong>Windows/Mac Network Share:</strong></p>
+                        <ul>
+                            <li>Windows: <code>\\[RASPBERRY_PI_IP]\family_center_media</code></li>
+                            <li>Mac: <code>smb://[RASPBERRY_PI_IP]/family_center_media</code></li>
+                        </ul>
+                        <p><strong>SSH/SFTP Access:</strong></p>
+                        <ul>
+                            <li>SFTP: <code>sftp://[RASPBERRY_PI_IP]/home/pi/family_center/media</code></li>
+                        </ul>
+                    </div>
+                </div>
+            </div>
+        </div>
+
+        <!-- Calendar Section -->
+        <div id="calendar" class="tab-content">
+            <div class="section">
+                <h3>Calendar Configuration</h3>
+                <div class="form-group">
+                    <label>Calendar ID</label>
+                    <input type="text" id="google_calendar_calendar_id" placeholder="deckhousefamilycenter@gmail.com">
+                </div>
+                <div class="form-group">
+                    <label>iCal URL</label>
+                    <input type="text" id="google_calendar_ical_url" placeholder="https://calendar.google.com/calendar/ical/...">
+                </div>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label>Timezone</label>
+                        <select id="google_calendar_timezone">
+                            <option value="America/New_York">Eastern Time</option>
+                            <option value="America/Chicago">Central Time</option>
+                            <option value="America/Denver">Mountain Time</option>
+                            <option value="America/Los_Angeles">Pacific Time</option>
+                        </select>
+                    </div>
+                    <div class="form-group">
+                        <label>Sync Interval (minutes)</label>
+                        <input type="number" id="google_calendar_sync_interval_minutes" min="1" max="1440">
+                    </div>
+                </div>
+                <div class="form-group">
+                    <label>Use iCal</label>
+                    <select id="google_calendar_use_ical">
+                        <option value="true">Yes</option>
+                        <option value="false">No</option>
+                    </select>
+                </div>
+            </div>
+        </div>
+
+        <!-- Weather Section -->
+        <div id="weather" class="tab-content">
+            <div class="section">
+                <h3>Weather Configuration</h3>
+                <div class="form-group">
+                    <label>API Key</label>
+                    <input type="text" id="weather_api_key" placeholder="Enter OpenWeatherMap API key">
+                </div>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label>ZIP Code</label>
+                        <input type="text" id="weather_zip_code" placeholder="03110">
+                    </div>
+                    <div class="form-group">
+                        <label>Units</label>
+                        <select id="weather_units">
+                            <option value="imperial">Fahrenheit</option>
+                            <option value="metric">Celsius</option>
+                        </select>
+                    </div>
+                </div>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label>Sync Interval (minutes)</label>
+                        <input type="number" id="weather_sync_interval_minutes" min="1" max="1440">
+                    </div>
+                    <div class="form-group">
+                        <label>Download Radar</label>
+                        <select id="weather_download_radar">
+                            <option value="true">Yes</option>
+                            <option value="false">No</option>
+                        </select>
+                    </div>
+                </div>
+            </div>
+        </div>
+
+        <!-- Slideshow Section -->
+        <div id="slideshow" class="tab-content">
+            <div class="section">
+                <h3>Slideshow Configuration</h3>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label>Slide Duration (seconds)</label>
+                        <input type="number" id="slideshow_slide_duration_seconds" min="1" max="60">
+                    </div>
+                    <div class="form-group">
+                        <label>Shuffle Enabled</label>
+                        <select id="slideshow_shuffle_enabled">
+                            <option value="true">Yes</option>
+                            <option value="false">No</option>
+                        </select>
+                    </div>
+                </div>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label>Transitions Enabled</label>
+                        <select id="slideshow_transitions_enabled">
+                            <option value="true">Yes</option>
+                            <option value="false">No</option>
+                        </select>
+                    </div>
+                    <div class="form-group">
+                        <label>Transition Type</label>
+                        <select id="slideshow_transition_type">
+                            <option value="crossfade">Crossfade</option>
+                            <option value="fade">Fade</option>
+                            <option value="none">None</option>
+                        </select>
+                    </div>
+                </div>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label>Transition Duration (seconds)</label>
+                        <input type="number" id="slideshow_transition_duration" min="0.1" max="5" step="0.1">
+                    </div>
+                    <div class="form-group">
+                        <label>Ease Type</label>
+                        <select id="slideshow_ease_type">
+                            <option value="linear">Linear</option>
+                            <option value="ease_in">Ease In</option>
+                            <option value="ease_out">Ease Out</option>
+                            <option value="ease_in_out">Ease In/Out</option>
+                        </select>
+                    </div>
+                </div>
+                <div class="form-group">
+                    <label>Video Playback Enabled</label>
+                    <select id="slideshow_video_enabled">
+                        <option value="true">Yes</option>
+                        <option value="false">No</option>
+                    </select>
+                </div>
+
+
+            </div>
+        </div>
+
+        <!-- Web Content Section -->
+        <div id="web-content" class="tab-content">
+            <div class="section">
+                <h3>Web Content Configuration</h3>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label>Service Enabled</label>
+                        <select id="web_content_enabled">
+                            <option value="true">Yes</option>
+                            <option value="false">No</option>
+                        </select>
+                        <div class="help-text">Enable web content screenshot capture</div>
+                    </div>
+                    <div class="form-group">
+                        <label>Auto Sync on Startup</label>
+                        <select id="web_content_auto_sync_on_startup">
+                            <option value="true">Yes</option>
+                            <option value="false">No</option>
+                        </select>
+                    </div>
+                </div>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label>Sync Interval (minutes)</label>
+                        <input type="number" id="web_content_sync_interval_minutes" min="1" max="1440">
+                    </div>
+                    <div class="form-group">
+                        <label>Output Folder</label>
+                        <input type="text" id="web_content_output_folder" placeholder="media/web_news">
+                    </div>
+                </div>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label>Image Width</label>
+                        <input type="number" id="web_content_image_width" min="800" max="3840">
+                    </div>
+                    <div class="form-group">
+                        <label>Image Height</label>
+                        <input type="number" id="web_content_image_height" min="600" max="2160">
+                    </div>
+                </div>
+                <div class="form-row">
+                    <div class="form-group">
+                        <label>Cleanup Old Files</label>
+                        <select id="web_content_cleanup_old_files">
+                            <option value="true">Yes</option>
+                            <option value="false">No</option>
+                        </select>
+                    </div>
+                    <div class="form-group">
+                        <label>Max File Age (hours)</label>
+                        <input type="number" id="web_content_max_file_age_hours" min="1" max="168">
+                    </div>
+                </div>
+            </div>
+
+            <div class="section">
+                <h3>Web Content Targets</h3>
+                <div class="help-text">Note: Many targets use specialized parsers and don't rely on CSS selectors. The selector field is only used for basic screenshot capture.</div>
+                <div id="web-content-targets"></div>
+                <button class="btn btn-secondary" onclick="addWebTarget()">Add Target</button>
+            </div>
+        </div>
+
+        <!-- Time Weighting Section -->
+        <div id="weighting" class="tab-content">
+            <div class="section">
+                <h3>Time-Based Weighting</h3>
+                <div class="form-group">
+                    <label>Time Weighting Enabled</label>
+                    <select id="weighting_enabled">
+                        <option value="true">Yes</option>
+                        <option value="false">No</option>
+                    </select>
+                </div>
+                <div class="form-group">
+                    <label>Day of Week Enabled</label>
+                    <select id="weighting_day_of_week_enabled">
+                        <option value="true">Yes</option>
+                        <option value="false">No</option>
+                    </select>
+                </div>
+                <div id="weighting-validation" style="margin: 1em 0;"></div>
+                <div id="weighting-table-container">
+                    <h4>Current Weighting</h4>
+                    <div id="weighting-table"></div>
+                </div>
+            </div>
+        </div>
+
+        <div style="margin-top: 2em; text-align: center;">
+            <button class="btn btn-success" onclick="saveConfig()">Save All Changes</button>
+            <button class="btn btn-secondary" onclick="loadConfig()">Reload Config</button>
+        </div>
+    </div>
+
+    <script>
+    let currentConfig = {};
+
+    function showTab(tabName) {
+        // Hide all tab contents
+        document.querySelectorAll('.tab-content').forEach(tab => tab.classList.remove('active'));
+        document.querySelectorAll('.tab').forEach(tab => tab.classList.remove('active'));
+
+        // Show selected tab
+        document.getElementById(tabName).classList.add('active');
+        event.target.classList.add('active');
+    }
+
+    function loadConfig() {
+        fetch('/api/config').then(r => r.json()).then(cfg => {
+            currentConfig = cfg;
+            populateForm(cfg);
+            renderWeightingTable(cfg);
+            renderWebTargets(cfg);
+        });
+    }
+
+    function populateForm(cfg) {
+        // Google Drive
+        if (cfg.google_drive) {
+            document.getElementById('google_drive_shared_folder_id').value = cfg.google_drive.shared_folder_id || '';
+            document.getElementById('google_drive_local_media_path').value = cfg.google_drive.local_media_path || '';
+            document.getElementById('google_drive_sync_interval_minutes').value = cfg.google_drive.sync_interval_minutes || 30;
+            document.getElementById('google_drive_auto_sync_on_startup').value = cfg.google_drive.auto_sync_on_startup || false;
+            document.getElementById('google_drive_credentials_path').value = cfg.google_drive.service_account_file || 'credentials/service-account.json';
+        }
+
+        // Calendar
+        if (cfg.google_calendar) {
+            document.getElementById('google_calendar_calendar_id').value = cfg.google_calendar.calendar_id || '';
+            document.getElementById('google_calendar_ical_url').value = cfg.google_calendar.ical_url || '';
+            document.getElementById('google_calendar_timezone').value = cfg.google_calendar.timezone || 'America/New_York';
+            document.getElementById('google_calendar_sync_interval_minutes').value = cfg.google_calendar.sync_interval_minutes || 60;
+            document.getElementById('google_calendar_use_ical').value = cfg.google_calendar.use_ical || true;
+        }
+
+        // Weather
+        if (cfg.weather) {
+            document.getElementById('weather_api_key').value = cfg.weather.api_key || '';
+            document.getElementById('weather_zip_code').value = cfg.weather.zip_code || '';
+            document.getElementById('weather_units').value = cfg.weather.units || 'imperial';
+            document.getElementById('weather_sync_interval_minutes').value = cfg.weather.sync_interval_minutes || 60;
+            document.getElementById('weather_download_radar').value = cfg.weather.download_radar || true;
+        }
+
+        // Slideshow
+        if (cfg.slideshow) {
+            document.getElementById('slideshow_slide_duration_seconds').value = cfg.slideshow.slide_duration_seconds || 5;
+            document.getElementById('slideshow_shuffle_enabled').value = cfg.slideshow.shuffle_enabled || false;
+            document.getElementById('slideshow_transitions_enabled').value = cfg.slideshow.transitions?.enabled || false;
+            document.getElementById('slideshow_transition_type').value = cfg.slideshow.transitions?.type || 'crossfade';
+            document.getElementById('slideshow_transition_duration').value = cfg.slideshow.transitions?.duration_seconds || 0.3;
+            document.getElementById('slideshow_ease_type').value = cfg.slideshow.transitions?.ease_type || 'linear';
+            document.getElementById('slideshow_video_enabled').value = cfg.slideshow.video_playback?.enabled || false;
+        }
+
+
+
+        // Weighting
+        if (cfg.slideshow?.weighted_media?.time_based_weighting) {
+            document.getElementById('weighting_enabled').value = cfg.slideshow.weighted_media.time_based_weighting.enabled || false;
+            document.getElementById('weighting_day_of_week_enabled').value = cfg.slideshow.weighted_media.time_based_weighting.day_of_week_enabled || false;
+        }
+
+        // Web Content
+        if (cfg.web_content) {
+            document.getElementById('web_content_enabled').value = cfg.web_content.enabled || false;
+            document.getElementById('web_content_auto_sync_on_startup').value = cfg.web_content.auto_sync_on_startup || false;
+            document.getElementById('web_content_sync_interval_minutes').value = cfg.web_content.sync_interval_minutes || 30;
+            document.getElementById('web_content_output_folder').value = cfg.web_content.output_folder || 'media/web_news';
+            document.getElementById('web_content_image_width').value = cfg.web_content.image_width || 1920;
+            document.getElementById('web_content_image_height').value = cfg.web_content.image_height || 1080;
+            document.getElementById('web_content_cleanup_old_files').value = cfg.web_content.cleanup_old_files || true;
+            document.getElementById('web_content_max_file_age_hours').value = cfg.web_content.max_file_age_hours || 24;
+        }
+    }
+
+    function renderWebTargets(cfg) {
+        const container = document.getElementById('web-content-targets');
+        container.innerHTML = '';
+
+        if (cfg.web_content?.targets) {
+            cfg.web_content.targets.forEach((target, index) => {
+                const div = document.createElement('div');
+                div.className = 'list-item';
+                div.innerHTML = `
+                    <div class="form-row">
+                        <div class="form-group">
+                            <label>Name</label>
+                            <input type="text" value="${target.name}" onchange="updateWebTarget(${index}, 'name', this.value)">
+                        </div>
+                        <div class="form-group">
+                            <label>URL</label>
+                            <input type="text" value="${target.url}" onchange="updateWebTarget(${index}, 'url', this.value)">
+                        </div>
+                    </div>
+                    <div class="form-row">
+                        <div class="form-group">
+                            <label>Selector</label>
+                            <input type="text" value="${target.selector}" onchange="updateWebTarget(${index}, 'selector', this.value)">
+                            <div class="help-text">CSS selector for screenshot capture (not used by specialized parsers)</div>
+                        </div>
+                        <div class="form-group">
+                            <label>Enabled</label>
+                            <select onchange="updateWebTarget(${index}, 'enabled', this.value === 'true')">
+                                <option value="true" ${target.enabled ? 'selected' : ''}>Yes</option>
+                                <option value="false" ${!target.enabled ? 'selected' : ''}>No</option>
+                            </select>
+                        </div>
+                    </div>
+                    <button class="btn btn-danger" onclick="removeWebTarget(${index})">Remove</button>
+                `;
+                container.appendChild(div);
+            });
+        }
+    }
+
+    function updateWebTarget(index, field, value) {
+        if (!currentConfig.web_content) currentConfig.web_content = {};
+        if (!currentConfig.web_content.targets) currentConfig.web_content.targets = [];
+        if (!currentConfig.web_content.targets[index]) currentConfig.web_content.targets[index] = {};
+        currentConfig.web_content.targets[index][field] = value;
+    }
+
+    function addWebTarget() {
+        if (!currentConfig.web_content) currentConfig.web_content = {};
+        if (!currentConfig.web_content.targets) currentConfig.web_content.targets = [];
+        currentConfig.web_content.targets.push({
+            name: 'New Target',
+            url: 'https://example.com',
+            selector: 'body',
+            enabled: true
+        });
+        renderWebTargets(currentConfig);
+    }
+
+    function removeWebTarget(index) {
+        if (currentConfig.web_content?.targets) {
+            currentConfig.web_content.targets.splice(index, 1);
+            renderWebTargets(currentConfig);
+        }
+    }
+
+    function renderWeightingTable(cfg) {
+        let html = '';
+        try {
+            let tbw = cfg.slideshow?.weighted_media?.time_based_weighting;
+            if (tbw?.day_of_week_enabled && tbw.daily_time_ranges) {
+                html += '<table class="weighting-table"><tr><th>Day</th><th>Range</th><th>Media</th><th>Calendar</th><th>Weather</th><th>Web News</th></tr>';
+                let days = ['Mon','Tue','Wed','Thu','Fri','Sat','Sun'];
+                for (let d=0; d<7; ++d) {
+                    let ranges = tbw.daily_time_ranges[d];
+                    for (let r of ranges) {
+                        html += `<tr><td>${days[d]}</td><td>${r.name}</td><td>${r.weights.media}</td><td>${r.weights.calendar}</td><td>${r.weights.weather}</td><td>${r.weights.web_news}</td></tr>`;
+                    }
+                }
+                html += '</table>';
+            } else if (tbw?.hourly_weights) {
+                html += '<table class="weighting-table"><tr><th>Hour</th><th>Media</th><th>Calendar</th><th>Weather</th><th>Web News</th></tr>';
+                for (let h=0; h<24; ++h) {
+                    let w = tbw.hourly_weights[h];
+                    html += `<tr><td>${h}</td><td>${w.media}</td><td>${w.calendar}</td><td>${w.weather}</td><td>${w.web_news}</td></tr>`;
+                }
+                html += '</table>';
+            } else {
+                html = '<i>No time-based weighting config found.</i>';
+            }
+        } catch (e) {
+            html = '<i>Error rendering weighting table.</i>';
+        }
+        document.getElementById('weighting-table').innerHTML = html;
+
+        // Validate weighting configuration
+        validateWeighting();
+    }
+
+    function validateWeighting() {
+        fetch('/api/config/validate-weighting').then(r => r.json()).then(result => {
+            const container = document.getElementById('weighting-validation');
+            if (result.valid) {
+                container.innerHTML = '<div class="success">✅ Time weighting configuration is valid!</div>';
+            } else {
+                let errorHtml = '<div class="error"><strong>❌ Time weighting validation errors:</strong><ul>';
+                result.errors.forEach(error => {
+                    errorHtml += `<li>${error}</li>`;
+                });
+                errorHtml += '</ul></div>';
+                container.innerHTML = errorHtml;
+            }
+        }).catch(err => {
+            document.getElementById('weighting-validation').innerHTML =
+                '<div class="error">❌ Error validating weighting: ' + err + '</div>';
+        });
+    }
+
+    function saveConfig() {
+        // Update currentConfig from form values
+        if (!currentConfig.google_drive) currentConfig.google_drive = {};
+        if (!currentConfig.google_calendar) currentConfig.google_calendar = {};
+        if (!currentConfig.weather) currentConfig.weather = {};
+        if (!currentConfig.slideshow) currentConfig.slideshow = {};
+        if (!currentConfig.slideshow.transitions) currentConfig.slideshow.transitions = {};
+        if (!currentConfig.slideshow.video_playback) currentConfig.slideshow.video_playback = {};
+        if (!currentConfig.slideshow.weighted_media) currentConfig.slideshow.weighted_media = {};
+        if (!currentConfig.slideshow.weighted_media.time_based_weighting) currentConfig.slideshow.weighted_media.time_based_weighting = {};
+
+
+        // Google Drive
+        currentConfig.google_drive.shared_folder_id = document.getElementById('google_drive_shared_folder_id').value;
+        currentConfig.google_drive.local_media_path = document.getElementById('google_drive_local_media_path').value;
+        currentConfig.google_drive.sync_interval_minutes = parseInt(document.getElementById('google_drive_sync_interval_minutes').value);
+        currentConfig.google_drive.auto_sync_on_startup = document.getElementById('google_drive_auto_sync_on_startup').value === 'true';
+
+        // Calendar
+        currentConfig.google_calendar.calendar_id = document.getElementById('google_calendar_calendar_id').value;
+        currentConfig.google_calendar.ical_url = document.getElementById('google_calendar_ical_url').value;
+        currentConfig.google_calendar.timezone = document.getElementById('google_calendar_timezone').value;
+        currentConfig.google_calendar.sync_interval_minutes = parseInt(document.getElementById('google_calendar_sync_interval_minutes').value);
+        currentConfig.google_calendar.use_ical = document.getElementById('google_calendar_use_ical').value === 'true';
+
+        // Weather
+        currentConfig.weather.api_key = document.getElementById('weather_api_key').value;
+        currentConfig.weather.zip_code = document.getElementById('weather_zip_code').value;
+        currentConfig.weather.units = document.getElementById('weather_units').value;
+        currentConfig.weather.sync_interval_minutes = parseInt(document.getElementById('weather_sync_interval_minutes').value);
+        currentConfig.weather.download_radar = document.getElementById('weather_download_radar').value === 'true';
+
+        // Slideshow
+        currentConfig.slideshow.slide_duration_seconds = parseInt(document.getElementById('slideshow_slide_duration_seconds').value);
+        currentConfig.slideshow.shuffle_enabled = document.getElementById('slideshow_shuffle_enabled').value === 'true';
+        currentConfig.slideshow.transitions.enabled = document.getElementById('slideshow_transitions_enabled').value === 'true';
+        currentConfig.slideshow.transitions.type = document.getElementById('slideshow_transition_type').value;
+        currentConfig.slideshow.transitions.duration_seconds = parseFloat(document.getElementById('slideshow_transition_duration').value);
+        currentConfig.slideshow.transitions.ease_type = document.getElementById('slideshow_ease_type').value;
+        currentConfig.slideshow.video_playback.enabled = document.getElementById('slideshow_video_enabled').value === 'true';
+
+        // Weighting
+        currentConfig.slideshow.weighted_media.time_based_weighting.enabled = document.getElementById('weighting_enabled').value === 'true';
+        currentConfig.slideshow.weighted_media.time_based_weighting.day_of_week_enabled = document.getElementById('weighting_day_of_week_enabled').value === 'true';
+
+
+
+        // Web Content
+        if (!currentConfig.web_content) currentConfig.web_content = {};
+        currentConfig.web_content.enabled = document.getElementById('web_content_enabled').value === 'true';
+        currentConfig.web_content.auto_sync_on_startup = document.getElementById('web_content_auto_sync_on_startup').value === 'true';
+        currentConfig.web_content.sync_interval_minutes = parseInt(document.getElementById('web_content_sync_interval_minutes').value);
+        currentConfig.web_content.output_folder = document.getElementById('web_content_output_folder').value;
+        currentConfig.web_content.image_width = parseInt(document.getElementById('web_content_image_width').value);
+        currentConfig.web_content.image_height = parseInt(document.getElementById('web_content_image_height').value);
+        currentConfig.web_content.cleanup_old_files = document.getElementById('web_content_cleanup_old_files').value === 'true';
+        currentConfig.web_content.max_file_age_hours = parseInt(document.getElementById('web_content_max_file_age_hours').value);
+
+        // Save to server
+        fetch('/api/config', {
+            method: 'PUT',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(currentConfig)
+        }).then(r => r.json()).then(resp => {
+            const msg = document.getElementById('message');
+            if (resp.success) {
+                msg.innerHTML = '<div class="success">Config saved and reloaded successfully!</div>';
+                renderWeightingTable(currentConfig);
+            } else {
+                msg.innerHTML = '<div class="error">Error: ' + resp.message + '</div>';
+            }
+        }).catch(err => {
+            document.getElementById('message').innerHTML = '<div class="error">Error: ' + err + '</div>';
+        });
+    }
+
+    // Google Drive Credentials Functions
+    function handleCredentialsUpload(event) {
+        const file = event.target.files[0];
+        if (!file) return;
+
+        const formData = new FormData();
+        formData.append('credentials', file);
+
+        const statusDiv = document.getElementById('credentials-status');
+        statusDiv.innerHTML = '<div class="loading">Uploading credentials...</div>';
+
+        fetch('/api/google-drive/upload-credentials', {
+            method: 'POST',
+            body: formData
+        })
+        .then(response => response.json())
+        .then(result => {
+            if (result.success) {
+                statusDiv.innerHTML = '<div class="success">✅ Credentials uploaded successfully!</div>';
+                document.getElementById('google_drive_credentials_path').value = result.credentials_path;
+            } else {
+                statusDiv.innerHTML = '<div class="error">❌ Upload failed: ' + result.message + '</div>';
+            }
+        })
+        .catch(error => {
+            statusDiv.innerHTML = '<div class="error">❌ Upload error: ' + error.message + '</div>';
+        });
+    }
+
+    function testGoogleDriveConnection() {
+        const resultDiv = document.getElementById('connection-test-result');
+        resultDiv.innerHTML = '<div class="loading">Testing Google Drive connection...</div>';
+
+        fetch('/api/google-drive/test-connection', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({
+                folder_id: document.getElementById('google_drive_shared_folder_id').value
+            })
+        })
+        .then(response => response.json())
+        .then(result => {
+            if (result.success) {
+                resultDiv.innerHTML = '<div class="success">✅ Connection successful! Found ' + result.file_count + ' files in the folder.</div>';
+            } else {
+                resultDiv.innerHTML = '<div class="error">❌ Connection failed: ' + result.message + '</div>';
+            }
+        })
+        .catch(error => {
+            resultDiv.innerHTML = '<div class="error">❌ Test error: ' + error.message + '</div>';
+        });
+    }
+
+    // Load config on page load
+    loadConfig();
+    </script>
+</body>
+</html>
+"""
+
+
+def _dump_json(payload: Any) -> bytes:
+    """Serialize a payload to JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, default=str).encode("utf-8")
+
+
+def _json_response(payload: Any) -> Response:
+    """Build a JSON response from a payload or pre-serialized bytes."""
+    if not isinstance(payload, bytes):
+        payload = _dump_json(payload)
+    return Response(payload, mimetype="application/json")
+
+
 class WebConfigUI:
     """Web-based configuration interface for web content targets."""
 
@@ -39,11 +807,36 @@ class WebConfigUI:
         self.app = Flask(__name__)
         CORS(self.app)
 
+        # Templates compiled once and reused across requests
+        self._templates: dict[str, Template] = {}
+        self._dashboard_html: str | None = None
+
+        # Serialized config keyed by ConfigManager.version
+        self._config_json: tuple[int, bytes] = (-1, b"")
+
+        # Screenshot listing keyed by the output folder's mtime
+        self._screenshot_cache: tuple[int, list[Path]] = (-1, [])
+
         # Setup routes
         self._setup_routes()
 
         logger.info("WebConfigUI initialized")
 
+    def _list_screenshots(self) -> list[Path]:
+        """Return available screenshots, rescanning only when the folder changes."""
+        try:
+            mtime = self.web_content_service.output_folder.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        cached_mtime, cached_files = self._screenshot_cache
+        if mtime == cached_mtime:
+            return cached_files
+
+        files = self.web_content_service.get_available_screenshots()
+        self._screenshot_cache = (mtime, files)
+        return files
+
     def _setup_routes(self) -> None:
         """Setup Flask routes."""
 
@@ -243,22 +1036,21 @@ class WebConfigUI:
         @self.app.route("/api/screenshots", methods=["GET"])
         def get_screenshots() -> Any:
             """Get list of available screenshots."""
-            screenshots = self.web_content_service.get_available_screenshots()
-            return jsonify(
-                {
-                    "screenshots": [
-                        {
-                            "name": f.name,
-                            "path": str(f),
-                            "size": f.stat().st_size,
-                            "modified": datetime.fromtimestamp(
-                                f.stat().st_mtime
-                            ).isoformat(),
-                        }
-                        for f in screenshots
-                    ]
-                }
-            )
+            screenshots = []
+            for f in self._list_screenshots():
+                try:
+                    st = f.stat()
+                except OSError:
+                    continue
+                screenshots.append(
+                    {
+                        "name": f.name,
+                        "path": str(f),
+                        "size": st.st_size,
+                        "modified": datetime.fromtimestamp(st.st_mtime).isoformat(),
+                    }
+                )
+            return jsonify({"screenshots": screenshots})
 
         @self.app.route("/screenshots/<path:filename>")
         def serve_screenshot(filename: str) -> Any:
@@ -277,8 +1069,6 @@ class WebConfigUI:
                 return "File not found", 404
 
             # Use absolute path to ensure Flask can find the files
-            import os
-
             absolute_path = os.path.abspath(str(self.web_content_service.output_folder))
             logger.info(f"Absolute path: {absolute_path}")
 
@@ -337,7 +1127,13 @@ class WebConfigUI:
         @self.app.route("/api/config", methods=["GET"])
         def get_config() -> Any:
             """Get the full configuration as JSON."""
-            return jsonify(self.config_manager.to_dict())
+            version = self.config_manager.version
+            if self._config_json[0] != version:
+                self._config_json = (
+                    version,
+                    _dump_json(self.config_manager.to_dict()),
+                )
+            return _json_response(self._config_json[1])
 
         @self.app.route("/api/config", methods=["PUT"])
         def update_config() -> Any:
@@ -375,852 +1171,113 @@ class WebConfigUI:
                         400,
                     )
 
-                file = request.files["credentials"]
-                if file.filename == "":
+                upload = request.files["credentials"]
+                if not upload.filename:
                     return (
                         jsonify({"success": False, "message": "No file selected"}),
-                        400,
-                    )
-
-                if not file.filename.endswith(".json"):
-                    return (
-                        jsonify(
-                            {"success": False, "message": "File must be a JSON file"}
-                        ),
-                        400,
-                    )
-
-                # Create credentials directory if it doesn't exist
-                import os
-
-                credentials_dir = "credentials"
-                os.makedirs(credentials_dir, exist_ok=True)
-
-                # Save the credentials file
-                credentials_path = os.path.join(credentials_dir, "service-account.json")
-                file.save(credentials_path)
-
-                # Update the config to point to the new credentials file
-                config = self.config_manager.to_dict()
-                if "google_drive" not in config:
-                    config["google_drive"] = {}
-                config["google_drive"]["service_account_file"] = credentials_path
-                self.config_manager.set_config(config)
-                self.config_manager.save_config()
-
-                logger.info(f"Google Drive credentials uploaded to {credentials_path}")
-                return jsonify(
-                    {
-                        "success": True,
-                        "message": "Credentials uploaded successfully",
-                        "credentials_path": credentials_path,
-                    }
-                )
-
-            except Exception as e:
-                logger.error(f"Failed to upload credentials: {e}")
-                return jsonify({"success": False, "message": str(e)}), 500
-
-        @self.app.route("/api/google-drive/test-connection", methods=["POST"])
-        def test_google_drive_connection() -> Any:
-            """Test Google Drive connection with current credentials."""
-            try:
-                data = request.get_json()
-                folder_id = data.get("folder_id", "")
-
-                if not folder_id:
-                    return (
-                        jsonify({"success": False, "message": "Folder ID is required"}),
-                        400,
-                    )
-
-                # Import and test Google Drive service
-                from src.services.google_drive import GoogleDriveService
-
-                # Use the config manager directly since it now works like the original Config
-                config = self.config_manager
-                google_drive_service = GoogleDriveService(config)
-
-                # Test the connection by listing files
-                files = google_drive_service.list_files(folder_id)
-
-                logger.info(
-                    f"Google Drive connection test successful, found {len(files)} files"
-                )
-                return jsonify(
-                    {
-                        "success": True,
-                        "message": "Connection successful",
-                        "file_count": len(files),
-                    }
-                )
-
-            except Exception as e:
-                logger.error(f"Google Drive connection test failed: {e}")
-                return jsonify({"success": False, "message": str(e)}), 500
-
-        DASHBOARD_TEMPLATE = """
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <title>Family Center Config Dashboard</title>
-            <style>
-                body { font-family: sans-serif; margin: 2em; background: #f5f5f5; }
-                .container { max-width: 1200px; margin: 0 auto; background: white; padding: 2em; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-                .section { margin-bottom: 2em; padding: 1em; border: 1px solid #ddd; border-radius: 4px; }
-                .section h3 { margin-top: 0; color: #333; border-bottom: 2px solid #007cba; padding-bottom: 0.5em; }
-                .form-group { margin-bottom: 1em; }
-                .form-group label { display: block; font-weight: bold; margin-bottom: 0.5em; }
-                .form-group input, .form-group select, .form-group textarea { width: 100%; padding: 0.5em; border: 1px solid #ccc; border-radius: 4px; font-size: 14px; }
-                .form-row { display: flex; gap: 1em; }
-                .form-row .form-group { flex: 1; }
-                .btn { padding: 0.5em 1em; border: none; border-radius: 4px; cursor: pointer; font-size: 14px; }
-                .btn-primary { background: #007cba; color: white; }
-                .btn-secondary { background: #6c757d; color: white; }
-                .btn-danger { background: #dc3545; color: white; }
-                .btn-success { background: #28a745; color: white; }
-                .list-item { border: 1px solid #ddd; padding: 1em; margin-bottom: 1em; border-radius: 4px; background: #f9f9f9; }
-                .list-item .form-row { margin-bottom: 0.5em; }
-                .weighting-table { width: 100%; border-collapse: collapse; margin-top: 1em; }
-                .weighting-table th, .weighting-table td { border: 1px solid #ddd; padding: 0.5em; text-align: center; }
-                .weighting-table th { background: #f8f9fa; font-weight: bold; }
-                .success { color: #28a745; background: #d4edda; padding: 0.5em; border-radius: 4px; margin: 1em 0; }
-                .error { color: #dc3545; background: #f8d7da; padding: 0.5em; border-radius: 4px; margin: 1em 0; }
-                .tabs { display: flex; border-bottom: 1px solid #ddd; margin-bottom: 2em; }
-                .tab { padding: 1em; cursor: pointer; border: 1px solid transparent; border-bottom: none; }
-                .tab.active { background: white; border-color: #ddd; border-radius: 4px 4px 0 0; }
-                .tab-content { display: none; }
-                .tab-content.active { display: block; }
-                .help-text { font-size: 12px; color: #666; margin-top: 0.25em; }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>Family Center Config Dashboard</h1>
-                <div id="message"></div>
-
-                <div class="tabs">
-                    <div class="tab active" onclick="showTab('google-drive')">Google Drive</div>
-                    <div class="tab" onclick="showTab('local-media')">Local Media</div>
-                    <div class="tab" onclick="showTab('calendar')">Calendar</div>
-                    <div class="tab" onclick="showTab('weather')">Weather</div>
-                    <div class="tab" onclick="showTab('slideshow')">Slideshow</div>
-                    <div class="tab" onclick="showTab('web-content')">Web Content</div>
-                    <div class="tab" onclick="showTab('weighting')">Time Weighting</div>
-                </div>
-
-                <!-- Google Drive Section -->
-                <div id="google-drive" class="tab-content active">
-                    <div class="section">
-                        <h3>Google Drive Configuration</h3>
-
-                        <!-- Credentials Upload Section -->
-                        <div class="form-group">
-                            <label>Google Drive Service Account Credentials</label>
-                            <input type="file" id="google_drive_credentials_file" accept=".json" onchange="handleCredentialsUpload(event)">
-                            <div class="help-text">Upload your Google Drive service account JSON credentials file</div>
-                            <div id="credentials-status" style="margin-top: 10px;"></div>
-                        </div>
-
-                        <div class="form-group">
-                            <label>Current Credentials Path</label>
-                            <input type="text" id="google_drive_credentials_path" placeholder="credentials/service-account.json" readonly>
-                            <div class="help-text">Path to the current credentials file</div>
-                        </div>
-
-                        <div class="form-group">
-                            <button type="button" class="btn btn-primary" onclick="testGoogleDriveConnection()">Test Google Drive Connection</button>
-                            <div id="connection-test-result" style="margin-top: 10px;"></div>
-                        </div>
-
-                        <hr style="margin: 20px 0;">
-
-                        <div class="form-group">
-                            <label>Shared Folder ID</label>
-                            <input type="text" id="google_drive_shared_folder_id" placeholder="Enter Google Drive folder ID">
-                            <div class="help-text">The ID of the Google Drive folder to sync</div>
-                        </div>
-                        <div class="form-row">
-                            <div class="form-group">
-                                <label>Local Media Path</label>
-                                <input type="text" id="google_drive_local_media_path" placeholder="media/remote_drive">
-                            </div>
-                            <div class="form-group">
-                                <label>Sync Interval (minutes)</label>
-                                <input type="number" id="google_drive_sync_interval_minutes" min="1" max="1440">
-                            </div>
-                        </div>
-                        <div class="form-group">
-                            <label>Auto Sync on Startup</label>
-                            <select id="google_drive_auto_sync_on_startup">
-                                <option value="true">Yes</option>
-                                <option value="false">No</option>
-                            </select>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Local Media Network Access Section -->
-                <div id="local-media" class="tab-content">
-                    <div class="section">
-                        <h3>Local Media Network Access</h3>
-                        <div class="form-group">
-                            <label>Network Sharing Enabled</label>
-                            <select id="local_media_network_enabled">
-                                <option value="true">Yes</option>
-                                <option value="false">No</option>
-                            </select>
-                            <div class="help-text">Enable network access to media folders</div>
-                        </div>
-                        <div class="form-row">
-                            <div class="form-group">
-                                <label>HTTP Port</label>
-                                <input type="number" id="local_media_http_port" min="1024" max="65535" value="8081">
-                                <div class="help-text">Port for web-based file browser</div>
-                            </div>
-                            <div class="form-group">
-                                <label>SMB/CIFS Share Name</label>
-                                <input type="text" id="local_media_smb_share" placeholder="family_center_media">
-                                <div class="help-text">Windows/Mac network share name</div>
-                            </div>
-                        </div>
-                        <div class="form-group">
-                            <label>Media Folders to Share</label>
-                            <div id="media-folders-list">
-                                <div class="list-item">
-                                    <div class="form-row">
-                                        <div class="form-group">
-                                            <label>Folder Path</label>
-                                            <input type="text" value="media/remote_drive" readonly>
-                                        </div>
-                                        <div class="form-group">
-                                            <label>Access URL</label>
-                                            <input type="text" value="http://localhost:8081/remote_drive" readonly>
-                                        </div>
-                                    </div>
-                                    <div class="help-text">Google Drive synced media</div>
-                                </div>
-                                <div class="list-item">
-                                    <div class="form-row">
-                                        <div class="form-group">
-                                            <label>Folder Path</label>
-                                            <input type="text" value="media/web_news" readonly>
-                                        </div>
-                                        <div class="form-group">
-                                            <label>Access URL</label>
-                                            <input type="text" value="http://localhost:8081/web_news" readonly>
-                                        </div>
-                                    </div>
-                                    <div class="help-text">Web content screenshots</div>
-                                </div>
-                                <div class="list-item">
-                                    <div class="form-row">
-                                        <div class="form-group">
-                                            <label>Folder Path</label>
-                                            <input type="text" value="media/Weather" readonly>
-                                        </div>
-                                        <div class="form-group">
-                                            <label>Access URL</label>
-                                            <input type="text" value="http://localhost:8081/Weather" readonly>
-                                        </div>
-                                    </div>
-                                    <div class="help-text">Weather images and forecasts</div>
-                                </div>
-                            </div>
-                        </div>
-                        <div class="form-group">
-                            <label>Network Access Instructions</label>
-                            <div style="background: #f8f9fa; padding: 1em; border-radius: 4px; font-size: 14px;">
-                                <p><strong>Web Browser Access:</strong></p>
-                                <ul>
-                                    <li>From any device on your network: <code>http://[RASPBERRY_PI_IP]:8081</code></li>
-                                    <li>Browse folders and download files directly</li>
-                                </ul>
-                                <p><strong>Windows/Mac Network Share:</strong></p>
-                                <ul>
-                                    <li>Windows: <code>\\[RASPBERRY_PI_IP]\family_center_media</code></li>
-                                    <li>Mac: <code>smb://[RASPBERRY_PI_IP]/family_center_media</code></li>
-                                </ul>
-                                <p><strong>SSH/SFTP Access:</strong></p>
-                                <ul>
-                                    <li>SFTP: <code>sftp://[RASPBERRY_PI_IP]/home/pi/family_center/media</code></li>
-                                </ul>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Calendar Section -->
-                <div id="calendar" class="tab-content">
-                    <div class="section">
-                        <h3>Calendar Configuration</h3>
-                        <div class="form-group">
-                            <label>Calendar ID</label>
-                            <input type="text" id="google_calendar_calendar_id" placeholder="deckhousefamilycenter@gmail.com">
-                        </div>
-                        <div class="form-group">
-                            <label>iCal URL</label>
-                            <input type="text" id="google_calendar_ical_url" placeholder="https://calendar.google.com/calendar/ical/...">
-                        </div>
-                        <div class="form-row">
-                            <div class="form-group">
-                                <label>Timezone</label>
-                                <select id="google_calendar_timezone">
-                                    <option value="America/New_York">Eastern Time</option>
-                                    <option value="America/Chicago">Central Time</option>
-                                    <option value="America/Denver">Mountain Time</option>
-                                    <option value="America/Los_Angeles">Pacific Time</option>
-                                </select>
-                            </div>
-                            <div class="form-group">
-                                <label>Sync Interval (minutes)</label>
-                                <input type="number" id="google_calendar_sync_interval_minutes" min="1" max="1440">
-                            </div>
-                        </div>
-                        <div class="form-group">
-                            <label>Use iCal</label>
-                            <select id="google_calendar_use_ical">
-                                <option value="true">Yes</option>
-                                <option value="false">No</option>
-                            </select>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Weather Section -->
-                <div id="weather" class="tab-content">
-                    <div class="section">
-                        <h3>Weather Configuration</h3>
-                        <div class="form-group">
-                            <label>API Key</label>
-                            <input type="text" id="weather_api_key" placeholder="Enter OpenWeatherMap API key">
-                        </div>
-                        <div class="form-row">
-                            <div class="form-group">
-                                <label>ZIP Code</label>
-                                <input type="text" id="weather_zip_code" placeholder="03110">
-                            </div>
-                            <div class="form-group">
-                                <label>Units</label>
-                                <select id="weather_units">
-                                    <option value="imperial">Fahrenheit</option>
-                                    <option value="metric">Celsius</option>
-                                </select>
-                            </div>
-                        </div>
-                        <div class="form-row">
-                            <div class="form-group">
-                                <label>Sync Interval (minutes)</label>
-                                <input type="number" id="weather_sync_interval_minutes" min="1" max="1440">
-                            </div>
-                            <div class="form-group">
-                                <label>Download Radar</label>
-                                <select id="weather_download_radar">
-                                    <option value="true">Yes</option>
-                                    <option value="false">No</option>
-                                </select>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Slideshow Section -->
-                <div id="slideshow" class="tab-content">
-                    <div class="section">
-                        <h3>Slideshow Configuration</h3>
-                        <div class="form-row">
-                            <div class="form-group">
-                                <label>Slide Duration (seconds)</label>
-                                <input type="number" id="slideshow_slide_duration_seconds" min="1" max="60">
-                            </div>
-                            <div class="form-group">
-                                <label>Shuffle Enabled</label>
-                                <select id="slideshow_shuffle_enabled">
-                                    <option value="true">Yes</option>
-                                    <option value="false">No</option>
-                                </select>
-                            </div>
-                        </div>
-                        <div class="form-row">
-                            <div class="form-group">
-                                <label>Transitions Enabled</label>
-                                <select id="slideshow_transitions_enabled">
-                                    <option value="true">Yes</option>
-                                    <option value="false">No</option>
-                                </select>
-                            </div>
-                            <div class="form-group">
-                                <label>Transition Type</label>
-                                <select id="slideshow_transition_type">
-                                    <option value="crossfade">Crossfade</option>
-                                    <option value="fade">Fade</option>
-                                    <option value="none">None</option>
-                                </select>
-                            </div>
-                        </div>
-                        <div class="form-row">
-                            <div class="form-group">
-                                <label>Transition Duration (seconds)</label>
-                                <input type="number" id="slideshow_transition_duration" min="0.1" max="5" step="0.1">
-                            </div>
-                            <div class="form-group">
-                                <label>Ease Type</label>
-                                <select id="slideshow_ease_type">
-                                    <option value="linear">Linear</option>
-                                    <option value="ease_in">Ease In</option>
-                                    <option value="ease_out">Ease Out</option>
-                                    <option value="ease_in_out">Ease In/Out</option>
-                                </select>
-                            </div>
-                        </div>
-                        <div class="form-group">
-                            <label>Video Playback Enabled</label>
-                            <select id="slideshow_video_enabled">
-                                <option value="true">Yes</option>
-                                <option value="false">No</option>
-                            </select>
-                        </div>
-
-
-                    </div>
-                </div>
-
-                <!-- Web Content Section -->
-                <div id="web-content" class="tab-content">
-                    <div class="section">
-                        <h3>Web Content Configuration</h3>
-                        <div class="form-row">
-                            <div class="form-group">
-                                <label>Service Enabled</label>
-                                <select id="web_content_enabled">
-                                    <option value="true">Yes</option>
-                                    <option value="false">No</option>
-                                </select>
-                                <div class="help-text">Enable web content screenshot capture</div>
-                            </div>
-                            <div class="form-group">
-                                <label>Auto Sync on Startup</label>
-                                <select id="web_content_auto_sync_on_startup">
-                                    <option value="true">Yes</option>
-                                    <option value="false">No</option>
-                                </select>
-                            </div>
-                        </div>
-                        <div class="form-row">
-                            <div class="form-group">
-                                <label>Sync Interval (minutes)</label>
-                                <input type="number" id="web_content_sync_interval_minutes" min="1" max="1440">
-                            </div>
-                            <div class="form-group">
-                                <label>Output Folder</label>
-                                <input type="text" id="web_content_output_folder" placeholder="media/web_news">
-                            </div>
-                        </div>
-                        <div class="form-row">
-                            <div class="form-group">
-                                <label>Image Width</label>
-                                <input type="number" id="web_content_image_width" min="800" max="3840">
-                            </div>
-                            <div class="form-group">
-                                <label>Image Height</label>
-                                <input type="number" id="web_content_image_height" min="600" max="2160">
-                            </div>
-                        </div>
-                        <div class="form-row">
-                            <div class="form-group">
-                                <label>Cleanup Old Files</label>
-                                <select id="web_content_cleanup_old_files">
-                                    <option value="true">Yes</option>
-                                    <option value="false">No</option>
-                                </select>
-                            </div>
-                            <div class="form-group">
-                                <label>Max File Age (hours)</label>
-                                <input type="number" id="web_content_max_file_age_hours" min="1" max="168">
-                            </div>
-                        </div>
-                    </div>
-
-                    <div class="section">
-                        <h3>Web Content Targets</h3>
-                        <div class="help-text">Note: Many targets use specialized parsers and don't rely on CSS selectors. The selector field is only used for basic screenshot capture.</div>
-                        <div id="web-content-targets"></div>
-                        <button class="btn btn-secondary" onclick="addWebTarget()">Add Target</button>
-                    </div>
-                </div>
-
-                <!-- Time Weighting Section -->
-                <div id="weighting" class="tab-content">
-                    <div class="section">
-                        <h3>Time-Based Weighting</h3>
-                        <div class="form-group">
-                            <label>Time Weighting Enabled</label>
-                            <select id="weighting_enabled">
-                                <option value="true">Yes</option>
-                                <option value="false">No</option>
-                            </select>
-                        </div>
-                        <div class="form-group">
-                            <label>Day of Week Enabled</label>
-                            <select id="weighting_day_of_week_enabled">
-                                <option value="true">Yes</option>
-                                <option value="false">No</option>
-                            </select>
-                        </div>
-                        <div id="weighting-validation" style="margin: 1em 0;"></div>
-                        <div id="weighting-table-container">
-                            <h4>Current Weighting</h4>
-                            <div id="weighting-table"></div>
-                        </div>
-                    </div>
-                </div>
-
-                <div style="margin-top: 2em; text-align: center;">
-                    <button class="btn btn-success" onclick="saveConfig()">Save All Changes</button>
-                    <button class="btn btn-secondary" onclick="loadConfig()">Reload Config</button>
-                </div>
-            </div>
-
-            <script>
-            let currentConfig = {};
-
-            function showTab(tabName) {
-                // Hide all tab contents
-                document.querySelectorAll('.tab-content').forEach(tab => tab.classList.remove('active'));
-                document.querySelectorAll('.tab').forEach(tab => tab.classList.remove('active'));
-
-                // Show selected tab
-                document.getElementById(tabName).classList.add('active');
-                event.target.classList.add('active');
-            }
-
-            function loadConfig() {
-                fetch('/api/config').then(r => r.json()).then(cfg => {
-                    currentConfig = cfg;
-                    populateForm(cfg);
-                    renderWeightingTable(cfg);
-                    renderWebTargets(cfg);
-                });
-            }
-
-            function populateForm(cfg) {
-                // Google Drive
-                if (cfg.google_drive) {
-                    document.getElementById('google_drive_shared_folder_id').value = cfg.google_drive.shared_folder_id || '';
-                    document.getElementById('google_drive_local_media_path').value = cfg.google_drive.local_media_path || '';
-                    document.getElementById('google_drive_sync_interval_minutes').value = cfg.google_drive.sync_interval_minutes || 30;
-                    document.getElementById('google_drive_auto_sync_on_startup').value = cfg.google_drive.auto_sync_on_startup || false;
-                    document.getElementById('google_drive_credentials_path').value = cfg.google_drive.service_account_file || 'credentials/service-account.json';
-                }
-
-                // Calendar
-                if (cfg.google_calendar) {
-                    document.getElementById('google_calendar_calendar_id').value = cfg.google_calendar.calendar_id || '';
-                    document.getElementById('google_calendar_ical_url').value = cfg.google_calendar.ical_url || '';
-                    document.getElementById('google_calendar_timezone').value = cfg.google_calendar.timezone || 'America/New_York';
-                    document.getElementById('google_calendar_sync_interval_minutes').value = cfg.google_calendar.sync_interval_minutes || 60;
-                    document.getElementById('google_calendar_use_ical').value = cfg.google_calendar.use_ical || true;
-                }
-
-                // Weather
-                if (cfg.weather) {
-                    document.getElementById('weather_api_key').value = cfg.weather.api_key || '';
-                    document.getElementById('weather_zip_code').value = cfg.weather.zip_code || '';
-                    document.getElementById('weather_units').value = cfg.weather.units || 'imperial';
-                    document.getElementById('weather_sync_interval_minutes').value = cfg.weather.sync_interval_minutes || 60;
-                    document.getElementById('weather_download_radar').value = cfg.weather.download_radar || true;
-                }
-
-                // Slideshow
-                if (cfg.slideshow) {
-                    document.getElementById('slideshow_slide_duration_seconds').value = cfg.slideshow.slide_duration_seconds || 5;
-                    document.getElementById('slideshow_shuffle_enabled').value = cfg.slideshow.shuffle_enabled || false;
-                    document.getElementById('slideshow_transitions_enabled').value = cfg.slideshow.transitions?.enabled || false;
-                    document.getElementById('slideshow_transition_type').value = cfg.slideshow.transitions?.type || 'crossfade';
-                    document.getElementById('slideshow_transition_duration').value = cfg.slideshow.transitions?.duration_seconds || 0.3;
-                    document.getElementById('slideshow_ease_type').value = cfg.slideshow.transitions?.ease_type || 'linear';
-                    document.getElementById('slideshow_video_enabled').value = cfg.slideshow.video_playback?.enabled || false;
-                }
-
-
-
-                // Weighting
-                if (cfg.slideshow?.weighted_media?.time_based_weighting) {
-                    document.getElementById('weighting_enabled').value = cfg.slideshow.weighted_media.time_based_weighting.enabled || false;
-                    document.getElementById('weighting_day_of_week_enabled').value = cfg.slideshow.weighted_media.time_based_weighting.day_of_week_enabled || false;
-                }
-
-                // Web Content
-                if (cfg.web_content) {
-                    document.getElementById('web_content_enabled').value = cfg.web_content.enabled || false;
-                    document.getElementById('web_content_auto_sync_on_startup').value = cfg.web_content.auto_sync_on_startup || false;
-                    document.getElementById('web_content_sync_interval_minutes').value = cfg.web_content.sync_interval_minutes || 30;
-                    document.getElementById('web_content_output_folder').value = cfg.web_content.output_folder || 'media/web_news';
-                    document.getElementById('web_content_image_width').value = cfg.web_content.image_width || 1920;
-                    document.getElementById('web_content_image_height').value = cfg.web_content.image_height || 1080;
-                    document.getElementById('web_content_cleanup_old_files').value = cfg.web_content.cleanup_old_files || true;
-                    document.getElementById('web_content_max_file_age_hours').value = cfg.web_content.max_file_age_hours || 24;
-                }
-            }
-
-            function renderWebTargets(cfg) {
-                const container = document.getElementById('web-content-targets');
-                container.innerHTML = '';
-
-                if (cfg.web_content?.targets) {
-                    cfg.web_content.targets.forEach((target, index) => {
-                        const div = document.createElement('div');
-                        div.className = 'list-item';
-                        div.innerHTML = `
-                            <div class="form-row">
-                                <div class="form-group">
-                                    <label>Name</label>
-                                    <input type="text" value="${target.name}" onchange="updateWebTarget(${index}, 'name', this.value)">
-                                </div>
-                                <div class="form-group">
-                                    <label>URL</label>
-                                    <input type="text" value="${target.url}" onchange="updateWebTarget(${index}, 'url', this.value)">
-                                </div>
-                            </div>
-                            <div class="form-row">
-                                <div class="form-group">
-                                    <label>Selector</label>
-                                    <input type="text" value="${target.selector}" onchange="updateWebTarget(${index}, 'selector', this.value)">
-                                    <div class="help-text">CSS selector for screenshot capture (not used by specialized parsers)</div>
-                                </div>
-                                <div class="form-group">
-                                    <label>Enabled</label>
-                                    <select onchange="updateWebTarget(${index}, 'enabled', this.value === 'true')">
-                                        <option value="true" ${target.enabled ? 'selected' : ''}>Yes</option>
-                                        <option value="false" ${!target.enabled ? 'selected' : ''}>No</option>
-                                    </select>
-                                </div>
-                            </div>
-                            <button class="btn btn-danger" onclick="removeWebTarget(${index})">Remove</button>
-                        `;
-                        container.appendChild(div);
-                    });
-                }
-            }
+                        400,
+                    )
 
-            function updateWebTarget(index, field, value) {
-                if (!currentConfig.web_content) currentConfig.web_content = {};
-                if (!currentConfig.web_content.targets) currentConfig.web_content.targets = [];
-                if (!currentConfig.web_content.targets[index]) currentConfig.web_content.targets[index] = {};
-                currentConfig.web_content.targets[index][field] = value;
-            }
+                if not upload.filename.lower().endswith(".json"):
+                    return (
+                        jsonify(
+                            {"success": False, "message": "File must be a JSON file"}
+                        ),
+                        400,
+                    )
 
-            function addWebTarget() {
-                if (!currentConfig.web_content) currentConfig.web_content = {};
-                if (!currentConfig.web_content.targets) currentConfig.web_content.targets = [];
-                currentConfig.web_content.targets.push({
-                    name: 'New Target',
-                    url: 'https://example.com',
-                    selector: 'body',
-                    enabled: true
-                });
-                renderWebTargets(currentConfig);
-            }
+                # Validate the upload in memory before anything touches disk
+                raw = upload.stream.read()
+                try:
+                    json.loads(raw)
+                except ValueError:
+                    return (
+                        jsonify({"success": False, "message": "Invalid JSON file"}),
+                        400,
+                    )
 
-            function removeWebTarget(index) {
-                if (currentConfig.web_content?.targets) {
-                    currentConfig.web_content.targets.splice(index, 1);
-                    renderWebTargets(currentConfig);
-                }
-            }
+                # Create credentials directory if it doesn't exist
+                credentials_dir = "credentials"
+                os.makedirs(credentials_dir, exist_ok=True)
 
-            function renderWeightingTable(cfg) {
-                let html = '';
-                try {
-                    let tbw = cfg.slideshow?.weighted_media?.time_based_weighting;
-                    if (tbw?.day_of_week_enabled && tbw.daily_time_ranges) {
-                        html += '<table class="weighting-table"><tr><th>Day</th><th>Range</th><th>Media</th><th>Calendar</th><th>Weather</th><th>Web News</th></tr>';
-                        let days = ['Mon','Tue','Wed','Thu','Fri','Sat','Sun'];
-                        for (let d=0; d<7; ++d) {
-                            let ranges = tbw.daily_time_ranges[d];
-                            for (let r of ranges) {
-                                html += `<tr><td>${days[d]}</td><td>${r.name}</td><td>${r.weights.media}</td><td>${r.weights.calendar}</td><td>${r.weights.weather}</td><td>${r.weights.web_news}</td></tr>`;
-                            }
-                        }
-                        html += '</table>';
-                    } else if (tbw?.hourly_weights) {
-                        html += '<table class="weighting-table"><tr><th>Hour</th><th>Media</th><th>Calendar</th><th>Weather</th><th>Web News</th></tr>';
-                        for (let h=0; h<24; ++h) {
-                            let w = tbw.hourly_weights[h];
-                            html += `<tr><td>${h}</td><td>${w.media}</td><td>${w.calendar}</td><td>${w.weather}</td><td>${w.web_news}</td></tr>`;
-                        }
-                        html += '</table>';
-                    } else {
-                        html = '<i>No time-based weighting config found.</i>';
-                    }
-                } catch (e) {
-                    html = '<i>Error rendering weighting table.</i>';
-                }
-                document.getElementById('weighting-table').innerHTML = html;
+                # Write atomically so readers never see a partial file
+                credentials_path = os.path.join(credentials_dir, "service-account.json")
+                tmp_path = credentials_path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(raw)
+                os.replace(tmp_path, credentials_path)
 
-                // Validate weighting configuration
-                validateWeighting();
-            }
+                # Update the config to point to the new credentials file
+                config = self.config_manager.to_dict()
+                if "google_drive" not in config:
+                    config["google_drive"] = {}
+                config["google_drive"]["service_account_file"] = credentials_path
+                self.config_manager.set_config(config)
+                self.config_manager.save_config()
 
-            function validateWeighting() {
-                fetch('/api/config/validate-weighting').then(r => r.json()).then(result => {
-                    const container = document.getElementById('weighting-validation');
-                    if (result.valid) {
-                        container.innerHTML = '<div class="success">✅ Time weighting configuration is valid!</div>';
-                    } else {
-                        let errorHtml = '<div class="error"><strong>❌ Time weighting validation errors:</strong><ul>';
-                        result.errors.forEach(error => {
-                            errorHtml += `<li>${error}</li>`;
-                        });
-                        errorHtml += '</ul></div>';
-                        container.innerHTML = errorHtml;
+                logger.info(f"Google Drive credentials uploaded to {credentials_path}")
+                return jsonify(
+                    {
+                        "success": True,
+                        "message": "Credentials uploaded successfully",
+                        "credentials_path": credentials_path,
                     }
-                }).catch(err => {
-                    document.getElementById('weighting-validation').innerHTML =
-                        '<div class="error">❌ Error validating weighting: ' + err + '</div>';
-                });
-            }
+                )
 
-            function saveConfig() {
-                // Update currentConfig from form values
-                if (!currentConfig.google_drive) currentConfig.google_drive = {};
-                if (!currentConfig.google_calendar) currentConfig.google_calendar = {};
-                if (!currentConfig.weather) currentConfig.weather = {};
-                if (!currentConfig.slideshow) currentConfig.slideshow = {};
-                if (!currentConfig.slideshow.transitions) currentConfig.slideshow.transitions = {};
-                if (!currentConfig.slideshow.video_playback) currentConfig.slideshow.video_playback = {};
-                if (!currentConfig.slideshow.weighted_media) currentConfig.slideshow.weighted_media = {};
-                if (!currentConfig.slideshow.weighted_media.time_based_weighting) currentConfig.slideshow.weighted_media.time_based_weighting = {};
-
-
-                // Google Drive
-                currentConfig.google_drive.shared_folder_id = document.getElementById('google_drive_shared_folder_id').value;
-                currentConfig.google_drive.local_media_path = document.getElementById('google_drive_local_media_path').value;
-                currentConfig.google_drive.sync_interval_minutes = parseInt(document.getElementById('google_drive_sync_interval_minutes').value);
-                currentConfig.google_drive.auto_sync_on_startup = document.getElementById('google_drive_auto_sync_on_startup').value === 'true';
-
-                // Calendar
-                currentConfig.google_calendar.calendar_id = document.getElementById('google_calendar_calendar_id').value;
-                currentConfig.google_calendar.ical_url = document.getElementById('google_calendar_ical_url').value;
-                currentConfig.google_calendar.timezone = document.getElementById('google_calendar_timezone').value;
-                currentConfig.google_calendar.sync_interval_minutes = parseInt(document.getElementById('google_calendar_sync_interval_minutes').value);
-                currentConfig.google_calendar.use_ical = document.getElementById('google_calendar_use_ical').value === 'true';
-
-                // Weather
-                currentConfig.weather.api_key = document.getElementById('weather_api_key').value;
-                currentConfig.weather.zip_code = document.getElementById('weather_zip_code').value;
-                currentConfig.weather.units = document.getElementById('weather_units').value;
-                currentConfig.weather.sync_interval_minutes = parseInt(document.getElementById('weather_sync_interval_minutes').value);
-                currentConfig.weather.download_radar = document.getElementById('weather_download_radar').value === 'true';
-
-                // Slideshow
-                currentConfig.slideshow.slide_duration_seconds = parseInt(document.getElementById('slideshow_slide_duration_seconds').value);
-                currentConfig.slideshow.shuffle_enabled = document.getElementById('slideshow_shuffle_enabled').value === 'true';
-                currentConfig.slideshow.transitions.enabled = document.getElementById('slideshow_transitions_enabled').value === 'true';
-                currentConfig.slideshow.transitions.type = document.getElementById('slideshow_transition_type').value;
-                currentConfig.slideshow.transitions.duration_seconds = parseFloat(document.getElementById('slideshow_transition_duration').value);
-                currentConfig.slideshow.transitions.ease_type = document.getElementById('slideshow_ease_type').value;
-                currentConfig.slideshow.video_playback.enabled = document.getElementById('slideshow_video_enabled').value === 'true';
-
-                // Weighting
-                currentConfig.slideshow.weighted_media.time_based_weighting.enabled = document.getElementById('weighting_enabled').value === 'true';
-                currentConfig.slideshow.weighted_media.time_based_weighting.day_of_week_enabled = document.getElementById('weighting_day_of_week_enabled').value === 'true';
-
-
-
-                // Web Content
-                if (!currentConfig.web_content) currentConfig.web_content = {};
-                currentConfig.web_content.enabled = document.getElementById('web_content_enabled').value === 'true';
-                currentConfig.web_content.auto_sync_on_startup = document.getElementById('web_content_auto_sync_on_startup').value === 'true';
-                currentConfig.web_content.sync_interval_minutes = parseInt(document.getElementById('web_content_sync_interval_minutes').value);
-                currentConfig.web_content.output_folder = document.getElementById('web_content_output_folder').value;
-                currentConfig.web_content.image_width = parseInt(document.getElementById('web_content_image_width').value);
-                currentConfig.web_content.image_height = parseInt(document.getElementById('web_content_image_height').value);
-                currentConfig.web_content.cleanup_old_files = document.getElementById('web_content_cleanup_old_files').value === 'true';
-                currentConfig.web_content.max_file_age_hours = parseInt(document.getElementById('web_content_max_file_age_hours').value);
-
-                // Save to server
-                fetch('/api/config', {
-                    method: 'PUT',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify(currentConfig)
-                }).then(r => r.json()).then(resp => {
-                    const msg = document.getElementById('message');
-                    if (resp.success) {
-                        msg.innerHTML = '<div class="success">Config saved and reloaded successfully!</div>';
-                        renderWeightingTable(currentConfig);
-                    } else {
-                        msg.innerHTML = '<div class="error">Error: ' + resp.message + '</div>';
-                    }
-                }).catch(err => {
-                    document.getElementById('message').innerHTML = '<div class="error">Error: ' + err + '</div>';
-                });
-            }
+            except Exception as e:
+                logger.error(f"Failed to upload credentials: {e}")
+                return jsonify({"success": False, "message": str(e)}), 500
 
-            // Google Drive Credentials Functions
-            function handleCredentialsUpload(event) {
-                const file = event.target.files[0];
-                if (!file) return;
+        @self.app.route("/api/google-drive/test-connection", methods=["POST"])
+        def test_google_drive_connection() -> Any:
+            """Test Google Drive connection with current credentials."""
+            try:
+                data = request.get_json()
+                folder_id = data.get("folder_id", "")
 
-                const formData = new FormData();
-                formData.append('credentials', file);
+                if not folder_id:
+                    return (
+                        jsonify({"success": False, "message": "Folder ID is required"}),
+                        400,
+                    )
 
-                const statusDiv = document.getElementById('credentials-status');
-                statusDiv.innerHTML = '<div class="loading">Uploading credentials...</div>';
+                # Import and test Google Drive service
+                from src.services.google_drive import GoogleDriveService
 
-                fetch('/api/google-drive/upload-credentials', {
-                    method: 'POST',
-                    body: formData
-                })
-                .then(response => response.json())
-                .then(result => {
-                    if (result.success) {
-                        statusDiv.innerHTML = '<div class="success">✅ Credentials uploaded successfully!</div>';
-                        document.getElementById('google_drive_credentials_path').value = result.credentials_path;
-                    } else {
-                        statusDiv.innerHTML = '<div class="error">❌ Upload failed: ' + result.message + '</div>';
-                    }
-                })
-                .catch(error => {
-                    statusDiv.innerHTML = '<div class="error">❌ Upload error: ' + error.message + '</div>';
-                });
-            }
+                # Use the config manager directly since it now works like the original Config
+                config = self.config_manager
+                google_drive_service = GoogleDriveService(config)
 
-            function testGoogleDriveConnection() {
-                const resultDiv = document.getElementById('connection-test-result');
-                resultDiv.innerHTML = '<div class="loading">Testing Google Drive connection...</div>';
+                # Test the connection by listing files
+                files = google_drive_service.list_files(folder_id)
 
-                fetch('/api/google-drive/test-connection', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        folder_id: document.getElementById('google_drive_shared_folder_id').value
-                    })
-                })
-                .then(response => response.json())
-                .then(result => {
-                    if (result.success) {
-                        resultDiv.innerHTML = '<div class="success">✅ Connection successful! Found ' + result.file_count + ' files in the folder.</div>';
-                    } else {
-                        resultDiv.innerHTML = '<div class="error">❌ Connection failed: ' + result.message + '</div>';
+                logger.info(
+                    f"Google Drive connection test successful, found {len(files)} files"
+                )
+                return jsonify(
+                    {
+                        "success": True,
+                        "message": "Connection successful",
+                        "file_count": len(files),
                     }
-                })
-                .catch(error => {
-                    resultDiv.innerHTML = '<div class="error">❌ Test error: ' + error.message + '</div>';
-                });
-            }
+                )
 
-            // Load config on page load
-            loadConfig();
-            </script>
-        </body>
-        </html>
-        """
+            except Exception as e:
+                logger.error(f"Google Drive connection test failed: {e}")
+                return jsonify({"success": False, "message": str(e)}), 500
+
+        # Flask's environment autoescapes templates built from strings, so
+        # the compiled template already uses the markupsafe escaper
+        self._templates["dashboard"] = self.app.jinja_env.from_string(
+            DASHBOARD_TEMPLATE
+        )
 
         @self.app.route("/config")
         def config_dashboard() -> Response:
-            return render_template_string(DASHBOARD_TEMPLATE)
+            # The dashboard takes no per-request data, so render it once
+            if self._dashboard_html is None:
+                self._dashboard_html = self._templates["dashboard"].render()
+            return self._dashboard_html
 
         @self.app.route("/")
         def root_redirect() -> Response:
@@ -2046,11 +2103,8 @@ class WebConfigUI:
 
             config["web_content"]["targets"] = targets_config
 
-            # Save config by writing to file
-            import yaml
-
-            with open(self.config_manager.config_path, "w") as f:
-                yaml.dump(config, f, default_flow_style=False)
+            # Save config through the manager, which owns the file format
+            self.config_manager.save_config()
 
             logger.info("Web content targets saved to configuration")
 
@@ -2060,7 +2114,10 @@ class WebConfigUI:
     def start(self, host: str = "localhost", port: int = 8080) -> None:
         """Start the web configuration interface."""
         logger.info(f"Starting web configuration interface on http://{host}:{port}")
-        self.app.run(host=host, port=port, debug=False)
+        if WAITRESS_AVAILABLE:
+            serve(self.app, host=host, port=port, threads=8)
+        else:
+            self.app.run(host=host, port=port, debug=False, threaded=True)
 
     def stop(self) -> None:
         """Stop the web configuration interface."""
@@ -2102,254 +2159,7 @@ class WebConfigUI:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Visual Page Selector</title>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        h1 {
-            color: #333;
-            text-align: center;
-            margin-bottom: 30px;
-        }
-        .url-input {
-            display: flex;
-            gap: 10px;
-            margin-bottom: 20px;
-            align-items: center;
-        }
-        .url-input input {
-            flex: 1;
-            padding: 12px;
-            border: 2px solid #ddd;
-            border-radius: 4px;
-            font-size: 16px;
-        }
-        .url-input button {
-            padding: 12px 24px;
-            background-color: #007bff;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 16px;
-        }
-        .url-input button:hover {
-            background-color: #0056b3;
-        }
-        .page-viewer {
-            display: grid;
-            grid-template-columns: 1fr 300px;
-            gap: 20px;
-            height: 600px;
-        }
-        .iframe-container {
-            border: 2px solid #ddd;
-            border-radius: 4px;
-            overflow: hidden;
-            position: relative;
-        }
-        .page-iframe {
-            width: 100%;
-            height: 100%;
-            border: none;
-        }
-        .selector-panel {
-            border: 2px solid #ddd;
-            border-radius: 4px;
-            padding: 15px;
-            background-color: #f9f9f9;
-            overflow-y: auto;
-        }
-        .section-item {
-            border: 2px solid #ddd;
-            border-radius: 8px;
-            padding: 15px;
-            margin: 10px 0;
-            cursor: pointer;
-            transition: all 0.2s;
-            position: relative;
-        }
-        .section-item:hover {
-            border-color: #007bff;
-            background-color: #f8f9fa;
-        }
-        .section-item.selected {
-            border-color: #28a745;
-            background-color: #d4edda;
-        }
-        .section-item::before {
-            content: '';
-            position: absolute;
-            top: -5px;
-            left: -5px;
-            width: 20px;
-            height: 20px;
-            border: 2px solid #007bff;
-            border-radius: 50%;
-            background: white;
-            z-index: 1;
-        }
-        .section-item.selected::before {
-            background: #28a745;
-            border-color: #28a745;
-        }
-        .section-item.selected::after {
-            content: '✓';
-            position: absolute;
-            top: -2px;
-            left: 2px;
-            color: white;
-            font-weight: bold;
-            z-index: 2;
-        }
-        .section-checkbox {
-            position: absolute;
-            top: 10px;
-            right: 10px;
-            width: 20px;
-            height: 20px;
-            cursor: pointer;
-        }
-        .section-name {
-            font-weight: bold;
-            color: #333;
-            margin-bottom: 5px;
-        }
-        .section-selector {
-            font-family: monospace;
-            background: #f8f9fa;
-            padding: 5px;
-            border-radius: 3px;
-            font-size: 12px;
-            color: #666;
-            margin: 5px 0;
-        }
-        .section-preview {
-            color: #666;
-            font-size: 14px;
-            line-height: 1.4;
-            max-height: 60px;
-            overflow: hidden;
-            text-overflow: ellipsis;
-        }
-        .controls {
-            margin-top: 20px;
-            padding-top: 20px;
-            border-top: 1px solid #ddd;
-        }
-        .controls button {
-            width: 100%;
-            padding: 10px;
-            margin-bottom: 10px;
-            border: none;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 14px;
-        }
-        .btn-primary {
-            background-color: #28a745;
-            color: white;
-        }
-        .btn-primary:hover {
-            background-color: #218838;
-        }
-        .btn-secondary {
-            background-color: #6c757d;
-            color: white;
-        }
-        .btn-secondary:hover {
-            background-color: #5a6268;
-        }
-        .loading {
-            text-align: center;
-            padding: 20px;
-            color: #666;
-        }
-        .loading-spinner {
-            display: inline-block;
-            width: 40px;
-            height: 40px;
-            border: 4px solid #f3f3f3;
-            border-top: 4px solid #007bff;
-            border-radius: 50%;
-            animation: spin 1s linear infinite;
-            margin-bottom: 15px;
-        }
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-        .loading-steps {
-            text-align: left;
-            max-width: 300px;
-            margin: 0 auto;
-        }
-        .loading-step {
-            margin: 8px 0;
-            padding: 8px;
-            background-color: #f8f9fa;
-            border-radius: 4px;
-            border-left: 3px solid #dee2e6;
-        }
-        .loading-step.active {
-            border-left-color: #007bff;
-            background-color: #e3f2fd;
-        }
-        .loading-step.completed {
-            border-left-color: #28a745;
-            background-color: #d4edda;
-        }
-        .analyzing-indicator {
-            position: fixed;
-            top: 20px;
-            right: 20px;
-            background-color: #007bff;
-            color: white;
-            padding: 10px 15px;
-            border-radius: 20px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.2);
-            z-index: 1000;
-            display: none;
-        }
-        .analyzing-indicator .spinner {
-            display: inline-block;
-            width: 16px;
-            height: 16px;
-            border: 2px solid #ffffff;
-            border-top: 2px solid transparent;
-            border-radius: 50%;
-            animation: spin 1s linear infinite;
-            margin-right: 8px;
-        }
-        .error {
-            color: #dc3545;
-            padding: 10px;
-            background-color: #f8d7da;
-            border: 1px solid #f5c6cb;
-            border-radius: 4px;
-            margin-bottom: 15px;
-        }
-        .back-link {
-            display: inline-block;
-            margin-bottom: 20px;
-            color: #007bff;
-            text-decoration: none;
-        }
-        .back-link:hover {
-            text-decoration: underline;
-        }
-    </style>
+    <link rel="stylesheet" href="/static/page_selector.css">
 </head>
 <body>
     <div class="container">
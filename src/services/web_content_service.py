@@ -6,6 +6,7 @@ for inclusion in the slideshow with time-of-day weighting.
 """
 
 import logging
+import os
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -1353,11 +1354,18 @@ class WebContentService:
 
     def get_available_screenshots(self) -> list[Path]:
         """Get list of available screenshot files."""
-        if not self.output_folder.exists():
+        try:
+            with os.scandir(self.output_folder) as it:
+                return [
+                    Path(entry.path)
+                    for entry in it
+                    if entry.name.endswith(".png")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                ]
+        except OSError:
             return []
 
-        return list(self.output_folder.glob("*.png"))
-
     def get_target_by_name(self, name: str) -> WebContentTarget | None:
         """Get a target by name."""
         for target in self.targets:
@@ -26,6 +26,7 @@ except ImportError:
 
 from src.config.config_manager import ConfigManager
 from src.core.logging_config import get_logger
+from src.services.file_tracking import journal_size, load_tracking
 
 # Try to import color processing dependencies
 COLOR_ANALYSIS = True
@@ -1328,11 +1329,12 @@ class PygameSlideshowEngine:
         try:
             # Load file tracking data
             tracking_file = Path("media/remote_drive/.file_tracking.json")
-            if tracking_file.exists():
-                import json
+            if tracking_file.exists() or journal_size(tracking_file):
+                tracking_data = load_tracking(tracking_file)
 
-                with open(tracking_file) as f:
-                    tracking_data = json.load(f)
+                # Build a fresh cache and swap it in so a background reload
+                # never mutates the dict the display loop is reading
+                colors = dict(self.complementary_color_cache)
 
                 # Extract complementary colors for image files
                 for file_info in tracking_data.values():
@@ -1346,11 +1348,12 @@ class PygameSlideshowEngine:
                                 Path("media/remote_drive") / Path(file_path).name
                             )
 
-                        self.complementary_color_cache[file_path] = complementary_color
+                        colors[file_path] = complementary_color
                         logger.debug(
                             f"Loaded cached complementary color for {file_path}: {complementary_color}"
                         )
 
+                self.complementary_color_cache = colors
                 logger.info(
                     f"Loaded {len(self.complementary_color_cache)} cached complementary colors"
                 )
@@ -1361,6 +1364,10 @@ class PygameSlideshowEngine:
         except Exception as e:
             logger.warning(f"Failed to load cached complementary colors: {e}")
 
+    def reload_complementary_colors(self) -> None:
+        """Reload complementary colors after a background computation finishes."""
+        self._load_cached_complementary_colors()
+
     def preload_images(self, num_to_preload: int = 4) -> None:
         """Preload and process the first N images, showing a progress bar and using cached complementary colors."""
         if not self.media_items: